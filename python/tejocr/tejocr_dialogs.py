@@ -13,6 +13,17 @@ import unohelper
 
 # Standard Python imports
 import os
+import re
+import sys
+import platform
+import time
+import threading
+import logging
+import functools
+import importlib.util
+import types
+import concurrent.futures
+from collections.abc import Mapping
 
 # Diagnostic print
 print(f"DEBUG: tejocr_dialogs.py: Right before UNO interface imports. uno module: {uno}")
@@ -34,6 +45,18 @@ except ImportError:
         class XActionListener: pass
         class XItemListener: pass
 
+try:
+    from com.sun.star.awt import XTextListener
+except ImportError as e:
+    print(f"DEBUG: tejocr_dialogs.py: Warning - Could not import XTextListener: {e}")
+    class XTextListener: pass
+
+try:
+    from com.sun.star.awt import XFocusListener
+except ImportError as e:
+    print(f"DEBUG: tejocr_dialogs.py: Warning - Could not import XFocusListener: {e}")
+    class XFocusListener: pass
+
 # Import other UNO types with similar safety
 try:
     from com.sun.star.task import XJobExecutor
@@ -42,45 +65,423 @@ except ImportError as e:
     print(f"DEBUG: tejocr_dialogs.py: Warning - Could not import XJobExecutor: {e}")
     class XJobExecutor: pass
 
+# Message box constants used by show_settings_dialog, resolved once instead of on every open
+try:
+    from com.sun.star.awt.MessageBoxType import QUERYBOX as _MB_QUERYBOX
+    from com.sun.star.awt.MessageBoxButtons import BUTTONS_YES_NO_CANCEL as _MB_YES_NO_CANCEL
+except ImportError as e:
+    print(f"DEBUG: tejocr_dialogs.py: Warning - Could not import MessageBox constants: {e}")
+    _MB_QUERYBOX = 3 # Question box
+    _MB_YES_NO_CANCEL = 4
+
 # Then your project's modules
 from tejocr import uno_utils
 from tejocr import constants
-from tejocr import tejocr_engine # This also needs correct import order internally
 
 # Initialize logger for this module
 logger = uno_utils.get_logger("TejOCR.Dialogs")
 
-# We will import tejocr_engine when needed for OCR tasks
+# tejocr_engine (and through it PIL/pytesseract), json, importlib.metadata and subprocess are
+# imported inside the functions that need them, so loading this module at extension startup stays cheap
+
+# Host OS, used for platform-specific paths and guidance ("darwin", "linux", "windows", ...)
+_SYSTEM = platform.system().lower()
+
+# Common Tesseract install directories that exist on this machine, used as the browse start directory
+_DEFAULT_TESS_DIRS = tuple(p for p in {
+    "darwin": ("/usr/local/bin", "/opt/homebrew/bin", "/usr/bin"),
+    "linux": ("/usr/bin", "/usr/local/bin"),
+    "windows": ("C:\\Program Files\\Tesseract-OCR", "C:\\Program Files (x86)\\Tesseract-OCR")
+}.get(_SYSTEM, ()) if os.path.isdir(p))
+
+# Dialog XDL files, in the standard private:dialogs/ scheme LibreOffice recognizes for extensions
+_OPTIONS_DIALOG_URL = "private:dialogs/tejocr_options_dialog.xdl"
+_SETTINGS_DIALOG_URL = "private:dialogs/tejocr_settings_dialog.xdl"
 
-# Attempt to import pytesseract for language listing, but don't fail if not present yet
-PYTESSERACT_AVAILABLE = False
 PYTESSERACT_LANGUAGES = {}
-LANG_CODE_TO_NAME = { # Basic map, can be expanded or replaced by a better i18n solution
+PYTESSERACT_LANG_KEYS = () # Codes of PYTESSERACT_LANGUAGES in dropdown order
+PYTESSERACT_LANG_LABELS = () # Their display names, in the same order
+_LANGUAGES_EXEC = None # Tesseract executable PYTESSERACT_LANGUAGES was listed from
+LANG_CODE_TO_NAME = types.MappingProxyType({ # Basic map, can be expanded or replaced by a better i18n solution
     "eng": "English", "hin": "Hindi", "fra": "French", "deu": "German",
     "spa": "Spanish", "ita": "Italian", "por": "Portuguese", "rus": "Russian",
     "jpn": "Japanese", "kor": "Korean", "chi_sim": "Chinese (Simplified)",
     "chi_tra": "Chinese (Traditional)", "ara": "Arabic", "urd": "Urdu",
     "osd": "Orientation and Script Detection"
-}
+}) # Read-only, since the fallback path hands it out as-is
+
+# Fallback language map; callers only read it, so it is shared rather than copied per call
+_FALLBACK_LANGS = LANG_CODE_TO_NAME
+
+# --- UNO service cache ---
+# Toolkit and Desktop are process-wide singletons in LibreOffice; create them once per context.
+_SERVICE_CACHE = {} # id(ctx) -> {"toolkit": ..., "desktop": ...}
+
+def _services(ctx):
+    """Returns the cached Toolkit/Desktop services for ctx, creating them on first use."""
+    sid = id(ctx)
+    cached = _SERVICE_CACHE.get(sid)
+    if not cached:
+        sm = ctx.getServiceManager()
+        cached = {
+            "toolkit": sm.createInstanceWithContext("com.sun.star.awt.Toolkit", ctx),
+            "desktop": sm.createInstanceWithContext("com.sun.star.frame.Desktop", ctx),
+        }
+        _SERVICE_CACHE[sid] = cached
+    return cached
 
-try:
-    import pytesseract
-    PYTESSERACT_AVAILABLE = True
-except ImportError:
-    logger.warning("Pytesseract not available. Language list will be limited.")
+# --- Persistent Tesseract language cache ---
+# Listing languages spawns the Tesseract binary, so the result is persisted across
+# LibreOffice sessions and keyed on the executable path and its mtime.
+_LANG_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tejocr")
+_LANG_DISK_CACHE_FILE = os.path.join(_LANG_DISK_CACHE_DIR, "langs_cache.json")
+
+def _lang_cache_key(tess_exec):
+    """Returns the cache key for a Tesseract executable, or None if it cannot be stat'ed."""
+    try:
+        return [tess_exec, os.path.getmtime(tess_exec)]
+    except OSError:
+        return None
+
+def _load_lang_disk_cache(tess_exec):
+    """Returns the cached {code: display} map for tess_exec, or None if missing or stale."""
+    key = _lang_cache_key(tess_exec)
+    if key is None:
+        return None
+    import json
+    try:
+        with open(_LANG_DISK_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        logger.debug("Language disk cache missing or stale, will query Tesseract.")
+        return None
+    langs = cache.get("langs")
+    return langs if isinstance(langs, dict) and langs else None
+
+def _save_lang_disk_cache(tess_exec, langs):
+    """Persists the language map for tess_exec. Failures are logged and otherwise ignored."""
+    key = _lang_cache_key(tess_exec)
+    if key is None:
+        return
+    import json
+    # Written to a temp file and renamed into place, so a concurrent reader or a crash
+    # never sees a half-written cache
+    tmp_file = f"{_LANG_DISK_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_LANG_DISK_CACHE_DIR, exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "langs": langs}, f)
+        os.replace(tmp_file, _LANG_DISK_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write language disk cache: {e}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+def _clear_lang_disk_cache():
+    """Deletes the persisted language list so the next load queries Tesseract again."""
+    try:
+        os.remove(_LANG_DISK_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Could not remove language disk cache: {e}")
+
+def _list_langs(tess_exec):
+    """Returns the language codes reported by `tesseract --list-langs`.
+    Runs the binary directly rather than pointing pytesseract's global tesseract_cmd at it,
+    so it is safe to call from the OCR worker thread."""
+    proc = _spawn_capture([tess_exec, "--list-langs"], timeout=_TESSERACT_TIMEOUT)
+    if proc.returncode != 0:
+        raise RuntimeError(f"tesseract --list-langs exited with {proc.returncode}: "
+                           f"{proc.stderr.decode('utf-8', errors='replace').strip()}")
+    # Tesseract 3.x printed the list to stderr, 4.x and later to stdout; the first line is a header
+    out = (proc.stdout or proc.stderr).decode("utf-8", errors="replace")
+    # Interned like the LANG_CODE_TO_NAME keys, so name lookups match on identity
+    return [sys.intern(line.strip()) for line in out.splitlines()[1:] if line.strip()]
+
+@functools.lru_cache(maxsize=1)
+def _lang_display_map(lang_codes):
+    """Returns {code: display name} for a sorted tuple of codes; a refresh that finds the same
+    installed languages gets the already-built map back."""
+    return {code: LANG_CODE_TO_NAME.get(code, code) for code in lang_codes}
+
+@functools.lru_cache(maxsize=4)
+def _find_tess_cached(path_cfg):
+    """uno_utils.find_tesseract_executable memoized per configured path, so cold language loads
+    skip the isfile/PATH scan. Cleared on language refresh, path changes and forced dependency checks.
+    Like the OCR engine, also looks in the common install directories, which are often not on the
+    PATH of a LibreOffice started from the desktop (e.g. /opt/homebrew/bin on macOS)."""
+    found = uno_utils.find_tesseract_executable(path_cfg)
+    if found:
+        return found
+    exe_name = "tesseract.exe" if _SYSTEM == "windows" else "tesseract"
+    for directory in _DEFAULT_TESS_DIRS:
+        candidate = os.path.join(directory, exe_name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+_LANG_LOAD_LOCK = threading.Lock() # Serializes _load_tesseract_languages between the UI and worker threads
+
+def _load_tesseract_languages(ctx, force=False):
+    """Returns {code: display name} for the installed Tesseract languages, shared by both dialogs.
+    Served from memory, then the disk cache, then Tesseract itself; force=True discards both caches.
+    Thread-safe: a dialog opening while a background load runs waits for it instead of spawning tesseract again."""
+    global PYTESSERACT_LANGUAGES, PYTESSERACT_LANG_KEYS, PYTESSERACT_LANG_LABELS, _LANGUAGES_EXEC
+    with _LANG_LOAD_LOCK:
+        if force:
+            PYTESSERACT_LANGUAGES = {}
+            PYTESSERACT_LANG_KEYS = ()
+            PYTESSERACT_LANG_LABELS = ()
+            _clear_lang_disk_cache()
+            _find_tess_cached.cache_clear()
+        # The path setting is read on every call (any dialog may have changed it), and the
+        # in-memory list is only reused for the executable it was loaded from
+        tess_exec = None
+        try:
+            tess_path_cfg = uno_utils.get_setting(constants.CFG_KEY_TESSERACT_PATH, constants.DEFAULT_TESSERACT_PATH, ctx)
+            tess_exec = _find_tess_cached(tess_path_cfg)
+        except Exception as e:
+            logger.error(f"Error resolving Tesseract for the language list: {e}", exc_info=True)
+        if PYTESSERACT_LANGUAGES and tess_exec == _LANGUAGES_EXEC:
+            return PYTESSERACT_LANGUAGES
+        langs_map = None
+        try:
+            langs_map = _load_lang_disk_cache(tess_exec) if tess_exec else None
+            if langs_map:
+                logger.debug(f"Loaded {len(langs_map)} languages from disk cache.")
+            elif tess_exec:
+                try:
+                    # --list-langs names each installed traineddata once, so sorting alone is enough
+                    langs_map = _lang_display_map(tuple(sorted(_list_langs(tess_exec))))
+                    _save_lang_disk_cache(tess_exec, langs_map)
+                except Exception as e:
+                    logger.warning(f"Listing Tesseract languages failed: {e}. Falling back.", exc_info=True)
+        except Exception as e:
+            logger.error(f"Error getting Tesseract languages: {e}", exc_info=True)
+        if not langs_map:
+            logger.info("Tesseract languages not available, using fallback list.")
+            langs_map = _FALLBACK_LANGS
+        PYTESSERACT_LANGUAGES = langs_map
+        _LANGUAGES_EXEC = tess_exec
+        PYTESSERACT_LANG_KEYS = tuple(langs_map)
+        PYTESSERACT_LANG_LABELS = tuple(langs_map.values())
+        return PYTESSERACT_LANGUAGES
+
+def _refresh_tesseract_languages(ctx):
+    """Re-queries Tesseract for its languages. Returns (langs, changed), changed being False when
+    the list is the same as before, so callers can leave their dropdowns alone."""
+    previous = PYTESSERACT_LANGUAGES
+    langs = _load_tesseract_languages(ctx, force=True)
+    return langs, dict(langs) != dict(previous)
+
+# --- Static help texts (built once at import) ---
+_OPTIONS_HELP_TEXT = f"""{constants.EXTENSION_FULL_NAME} - OCR Options Help
+
+LANGUAGE SELECTION:
+• Choose the language of text in your image
+• Correct language selection improves accuracy
+• Use 'Refresh' to update available languages
+
+OUTPUT MODE:
+• Cursor: Insert text at current cursor position
+• Text Box: Create a new text box with the text
+• Replace Image: Replace selected image with text
+• Clipboard: Copy text to system clipboard
+
+ADVANCED OPTIONS:
+• Page Mode: How Tesseract should analyze the image
+• Engine Mode: Which OCR engine to use
+• Preprocessing: Basic image enhancement options
+
+BUTTONS:
+• Start OCR: Begin text recognition
+• Cancel: Close without processing
+• Help: Show this help message"""
+
+_SETTINGS_HELP_TEXT = f"""{constants.EXTENSION_FULL_NAME} - Settings Help
+
+DEPENDENCY STATUS:
+• Shows current status of required components
+• Green ✅ means component is working
+• Red ❌ means component needs installation
+
+TESSERACT CONFIGURATION:
+• Set path to Tesseract executable
+• Use 'Browse' to find installation
+• Use 'Test' to verify it works
+
+DEFAULT OPTIONS:
+• Set preferences for OCR operations
+• Language: Default recognition language
+• Preprocessing: Image enhancement options
+
+BUTTONS:
+• Save: Saves settings permanently
+• Cancel: Discards changes
+• Help: Shows this help message"""
+
+_INSTALL_GUIDE_TEMPLATE = """TejOCR Installation Guide
+
+{installation_guide}
+
+For more detailed instructions, visit:
+https://github.com/tesseract-ocr/tesseract/wiki
+
+Need help? Check the TejOCR documentation or contact support."""
+
+_INSTALLATION_HELP_TEXT = f"""Installation Help - {constants.EXTENSION_FULL_NAME}
+
+QUICK SETUP (macOS):
+
+1. Install Tesseract:
+   brew install tesseract
+
+2. Install Python packages:
+   /Applications/LibreOffice.app/Contents/Frameworks/LibreOfficePython.framework/Versions/Current/bin/python3 -m pip install pytesseract pillow
+
+3. Restart LibreOffice
+
+VERIFICATION:
+• Open Terminal
+• Run: tesseract --version
+• Should show version 5.x or higher
+
+TROUBLESHOOTING:
+• Ensure Homebrew is installed
+• Check Python packages in LibreOffice Python
+• Restart LibreOffice after installation
+
+PERFORMANCE NOTE:
+• TejOCR runs its Tesseract checks with OMP_THREAD_LIMIT=1
+  (OpenMP thread pools only slow down short runs)
+• Set OMP_THREAD_LIMIT yourself before starting LibreOffice to override
+
+Need more help? Check the extension documentation."""
+
+# Environment for Tesseract probes: OpenMP would start a thread per core just to print a version.
+# A value already set by the user takes precedence.
+_TESSERACT_ENV = {'OMP_THREAD_LIMIT': '1', **os.environ}
+_TESSERACT_TIMEOUT = 5 # seconds allowed for `tesseract --list-langs`; the version probe uses 1
+
+# Console fallback banner for show_settings_dialog
+_RULE = "=" * 60
+_SETTINGS_BANNER = "\n".join((_RULE, f"{constants.EXTENSION_FULL_NAME} - Settings", _RULE))
+_RULE_BYTES = (_RULE + "\n").encode('ascii')
+_SETTINGS_BANNER_BYTES = (_SETTINGS_BANNER + "\n").encode('ascii', 'replace')
+
+# Platform-specific installation guidance, keyed by _SYSTEM (None is the generic fallback)
+_INSTALL_GUIDE_BY_SYSTEM = {
+    "darwin": """🍎 macOS Installation:
+
+1️⃣ TESSERACT:
+   brew install tesseract
+
+2️⃣ PYTHON PACKAGES:
+   /Applications/LibreOffice.app/Contents/Frameworks/LibreOfficePython.framework/Versions/Current/bin/python3 -m pip install numpy pytesseract pillow
+
+3️⃣ VERIFY:
+   tesseract --version""",
+    "linux": """🐧 Linux Installation:
+
+1️⃣ TESSERACT:
+   sudo apt install tesseract-ocr   # Ubuntu/Debian
+   sudo dnf install tesseract       # Fedora
+   sudo pacman -S tesseract         # Arch
+
+2️⃣ PYTHON PACKAGES:
+   pip3 install numpy pytesseract pillow
+
+3️⃣ VERIFY:
+   tesseract --version""",
+    "windows": """🪟 Windows Installation:
+
+1️⃣ TESSERACT:
+   Download from: https://github.com/UB-Mannheim/tesseract/wiki
+   Run installer and add to PATH
+
+2️⃣ PYTHON PACKAGES:
+   pip install numpy pytesseract pillow
+
+3️⃣ VERIFY:
+   tesseract --version""",
+    None: """🖥️ General Installation:
+
+1️⃣ TESSERACT: Install from https://tesseract-ocr.github.io/
+2️⃣ PYTHON PACKAGES: pip install numpy pytesseract pillow
+3️⃣ VERIFY: tesseract --version"""
+}
 
 # --- Dialog Base Class (Optional, but can be useful for common functionality) ---
+class _DirtyKeyListener(unohelper.Base, XTextListener, XItemListener):
+    """Marks a settings key as changed when its control is edited."""
+    def __init__(self, dirty_keys, key):
+        self._dirty_keys = dirty_keys
+        self._key = key
+
+    def textChanged(self, event):
+        self._dirty_keys.add(self._key)
+
+    def itemStateChanged(self, event):
+        self._dirty_keys.add(self._key)
+
+    def disposing(self, event):
+        pass
+
+
+class _PopulateOnFocusListener(unohelper.Base, XFocusListener):
+    """Fills a dropdown the first time it gains focus, via populate(control_name)."""
+    def __init__(self, populate, control_name):
+        self._populate = populate
+        self._control_name = control_name
+
+    def focusGained(self, event):
+        self._populate(self._control_name)
+
+    def focusLost(self, event):
+        pass
+
+    def disposing(self, event):
+        pass
+
+
 class BaseDialogHandler(unohelper.Base, XActionListener, XItemListener):
+    _BUTTONS = () # (control name, action command) pairs wired to actionPerformed by _add_button_listeners
+    _REFRESH_MIN_INTERVAL = 1.0 # Seconds; refresh clicks closer together than this reuse the last result
+    _last_refresh_ts = 0.0
+    OK_PENDING = "pending" # _handle_ok_action result: accepted, the dialog is closed later by a worker callback
+
     def __init__(self, ctx, dialog_url):
         self.ctx = ctx
         self.dialog_url = dialog_url # e.g., "vnd.sun.star.script:TejOCR.TejOCRDialogs.py$OptionsDialog?location=user"
         self.dialog = None
         self.parent_frame = None
         self.closed_by_ok = False # Flag to indicate how the dialog was closed
+        self._control_cache = {} # name -> XControl, valid for the lifetime of self.dialog
+        # Action command -> handler; subclasses add or override entries in their __init__
+        self._command_handlers = {
+            "ok": self._on_ok,
+            "run_ocr": self._on_ok,
+            "save_settings": self._on_ok,
+            "cancel": self._on_cancel,
+            "help": self._handle_help_action,
+        }
 
     def _create_dialog(self, parent_frame):
-        """Creates and initializes the dialog from its URL."""
+        """Creates and initializes the dialog from its URL, or refreshes it if this handler already built one."""
         self.parent_frame = parent_frame
+        if self.dialog is not None:
+            # Reopening: the XDL was already parsed and the control tree built, only refresh the contents
+            try:
+                self._reload_controls()
+                return True
+            except Exception as e:
+                logger.debug(f"Could not reuse dialog {self.dialog_url}, recreating it: {e}")
+                self.dispose()
         try:
             dp = uno_utils.create_instance("com.sun.star.awt.DialogProvider", self.ctx)
             self.dialog = dp.createDialog(self.dialog_url)
@@ -102,8 +503,13 @@ class BaseDialogHandler(unohelper.Base, XActionListener, XItemListener):
         """Initialize dialog controls and attach listeners. To be implemented by subclasses."""
         pass # Override in specific dialog handlers
 
+    def _reload_controls(self):
+        """Refresh control contents when an existing dialog is shown again. To be implemented by subclasses."""
+        pass # Override in specific dialog handlers
+
     def execute(self):
-        """Shows the dialog modally and returns True if OK was pressed, False otherwise."""
+        """Shows the dialog modally and returns True if OK was pressed, False otherwise.
+        Closing only hides the dialog; it stays alive for the next _create_dialog until dispose()."""
         if not self.dialog:
             return False
         self.closed_by_ok = False # Reset before execution
@@ -117,34 +523,42 @@ class BaseDialogHandler(unohelper.Base, XActionListener, XItemListener):
         if self.dialog:
             self.dialog.dispose()
             self.dialog = None
+        self._control_cache.clear()
 
     # --- XActionListener --- (Common actions)
     def actionPerformed(self, event):
-        """Handles action events (e.g., button clicks)."""
+        """Handles action events (e.g., button clicks) by looking the command up in _command_handlers."""
         command = event.ActionCommand
-        # print(f"BaseDialog: ActionPerformed - {command}")
-        if command == "ok" or command == "run_ocr" or command == "save_settings": # Common OK/Run commands
-            self.closed_by_ok = True
-            logger.debug(f"Dialog '{self.dialog_url}' OK/Run action started for command: {command}")
-            if self._handle_ok_action(): # Only end execute if validation passes
-                logger.debug(f"Dialog '{self.dialog_url}' _handle_ok_action successful, ending execute.")
-                self.dialog.endExecute()
-            else:
-                logger.warning(f"Dialog '{self.dialog_url}' _handle_ok_action failed or returned False, not closing.")
-                self.closed_by_ok = False # Reset if validation failed
-        elif command == "cancel":
-            self.closed_by_ok = False
-            logger.debug(f"Dialog '{self.dialog_url}' Cancel action for command: {command}")
-            self._handle_cancel_action()
+        handler = self._command_handlers.get(command)
+        if handler is None:
+            logger.debug(f"Dialog '{self.dialog_url}' ignoring unknown action command: {command}")
+            return
+        logger.debug(f"Dialog '{self.dialog_url}' action: {command}")
+        handler()
+
+    def _on_ok(self):
+        """OK/Run/Save: ends the dialog only if _handle_ok_action accepts."""
+        self.closed_by_ok = True
+        result = self._handle_ok_action()
+        if result == self.OK_PENDING:
+            logger.debug(f"Dialog '{self.dialog_url}' _handle_ok_action started background work; dialog stays open.")
+            self.closed_by_ok = False # Set again by whatever closes the dialog
+        elif result: # Only end execute if validation passes
+            logger.debug(f"Dialog '{self.dialog_url}' _handle_ok_action successful, ending execute.")
             self.dialog.endExecute()
-        elif command == "help":
-            logger.debug(f"Dialog '{self.dialog_url}' Help action for command: {command}")
-            self._handle_help_action()
-        # Other commands to be handled by subclasses
+        else:
+            logger.warning(f"Dialog '{self.dialog_url}' _handle_ok_action failed or returned False, not closing.")
+            self.closed_by_ok = False # Reset if validation failed
+
+    def _on_cancel(self):
+        """Cancel: lets the subclass clean up, then closes the dialog."""
+        self.closed_by_ok = False
+        self._handle_cancel_action()
+        self.dialog.endExecute()
 
     def _handle_ok_action(self):
         """Placeholder for OK action. Subclasses should override if specific data needs to be saved."""
-        return True # Return True if OK, False if validation fails
+        return True # Return True if OK, False if validation fails, OK_PENDING if closing is deferred
 
     def _handle_cancel_action(self):
         """Placeholder for Cancel action."""
@@ -160,10 +574,29 @@ class BaseDialogHandler(unohelper.Base, XActionListener, XItemListener):
         pass # Override in specific dialog handlers
 
     def get_control(self, name):
-        """Helper to get a control from the dialog."""
-        if self.dialog:
-            return self.dialog.getControl(name)
-        return None
+        """Helper to get a control from the dialog. Lookups are cached, since controls live as long as the dialog."""
+        if not self.dialog:
+            return None
+        control = self._control_cache.get(name)
+        if control is None:
+            control = self.dialog.getControl(name)
+            if control is not None:
+                self._control_cache[name] = control
+        return control
+
+    def _state(self, name, default=False):
+        """Returns a checkbox/radio state as bool, or default if the dialog has no such control."""
+        control = self.get_control(name)
+        return bool(control.getState()) if control else default
+
+    def _refresh_too_soon(self):
+        """True if a language refresh ran within _REFRESH_MIN_INTERVAL; otherwise records this one.
+        Keeps double clicks from spawning tesseract --list-langs back to back."""
+        now = time.monotonic()
+        if now - self._last_refresh_ts < self._REFRESH_MIN_INTERVAL:
+            return True
+        self._last_refresh_ts = now
+        return False
 
     def _add_listener_to_control(self, control_name, action_command=None):
         control = self.get_control(control_name)
@@ -173,6 +606,11 @@ class BaseDialogHandler(unohelper.Base, XActionListener, XItemListener):
             control.addActionListener(self)
         return control
 
+    def _add_button_listeners(self):
+        """Attaches this handler to every (control name, action command) pair in _BUTTONS."""
+        for control_name, action_command in self._BUTTONS:
+            self._add_listener_to_control(control_name, action_command)
+
     def _add_item_listener_to_control(self, control_name):
         control = self.get_control(control_name)
         if control:
@@ -181,28 +619,113 @@ class BaseDialogHandler(unohelper.Base, XActionListener, XItemListener):
 
 # --- OCR Options Dialog Handler ---
 class OptionsDialogHandler(BaseDialogHandler):
+    _BUTTONS = (
+        ("RunOCRButton", "run_ocr"),
+        ("CancelButton", "cancel"),
+        ("HelpButton", "help"),
+        ("RefreshLanguagesButton", "refresh_languages"),
+    )
+    # Output mode <-> radio button control mapping, shared by load and collect paths
+    _OUTPUT_MODE_TO_CONTROL = {
+        constants.OUTPUT_MODE_CURSOR: "OutputAtCursorRadio",
+        constants.OUTPUT_MODE_TEXTBOX: "OutputNewTextboxRadio",
+        constants.OUTPUT_MODE_REPLACE: "OutputReplaceImageRadio",
+        constants.OUTPUT_MODE_CLIPBOARD: "OutputToClipboardRadio"
+    }
+    _CONTROL_TO_OUTPUT_MODE = {v: k for k, v in _OUTPUT_MODE_TO_CONTROL.items()}
+    # Dropdown keys and labels in display order, computed once rather than on every population
+    _PSM_KEYS = tuple(constants.TESSERACT_PSM_MODES)
+    _PSM_LABELS = tuple(constants.TESSERACT_PSM_MODES.values())
+    _OEM_KEYS = tuple(constants.TESSERACT_OEM_MODES)
+    _OEM_LABELS = tuple(constants.TESSERACT_OEM_MODES.values())
+    # Dropdowns filled on first focus instead of at open: the advanced ones most runs never touch,
+    # and the language list, which may need a tesseract subprocess
+    _LAZY_DROPDOWNS = ("LanguageDropdown", "PSMDropdown", "OEMDropdown")
+    # Settings the dialog reads when it is (re)loaded, fetched together in one pass
+    _LOAD_SETTING_DEFAULTS = {
+        constants.CFG_KEY_LAST_OUTPUT_MODE: constants.DEFAULT_OUTPUT_MODE,
+        constants.CFG_KEY_DEFAULT_GRAYSCALE: constants.DEFAULT_PREPROC_GRAYSCALE,
+        constants.CFG_KEY_DEFAULT_BINARIZE: constants.DEFAULT_PREPROC_BINARIZE,
+        constants.CFG_KEY_LAST_SELECTED_LANG: constants.DEFAULT_OCR_LANGUAGE,
+        "LastPSMMode": constants.DEFAULT_PSM_MODE,
+        "LastOEMMode": constants.DEFAULT_OEM_MODE,
+    }
+    # Collected option -> setting it is remembered under for the next run
+    _LAST_USED_KEYS = {
+        "output_mode": constants.CFG_KEY_LAST_OUTPUT_MODE,
+        "lang": constants.CFG_KEY_LAST_SELECTED_LANG,
+        "psm": "LastPSMMode",
+        "oem": "LastOEMMode",
+    }
+
     def __init__(self, ctx, ocr_source_type="file", image_path=None): # ocr_source_type: "file" or "selected"
-        # Use the standard private:dialogs/ scheme that LibreOffice recognizes for extension XDL files
-        dialog_url = "private:dialogs/tejocr_options_dialog.xdl"
-        super().__init__(ctx, dialog_url)
+        super().__init__(ctx, _OPTIONS_DIALOG_URL)
         self.ctx = ctx
         self.ocr_source_type = ocr_source_type  # "file" or "selected"
         self.image_path = image_path  # Path to image file (if ocr_source_type == "file") or None for selected
         self.selected_options = {}
         self.recognized_text = None
-        self.available_languages_map = {}
+        self._keys = {} # control name -> item keys in dropdown order, recorded when the dropdown is populated
+        self._key_pos = {} # control name -> {str(key): position}, rebuilt only when the items change
+        self._current_output_mode = None # Kept in sync by itemStateChanged on the output radios
+        self._ocr_thread = None # Worker running the OCR call, so the dialog stays responsive
+        self._ocr_run_id = 0 # Bumped per run and on cancel; _finish_ocr ignores results from other runs
+        self._loaded_settings = {} # Values of _LOAD_SETTING_DEFAULTS read by _reload_controls
+        self._command_handlers["refresh_languages"] = self._refresh_languages
+        self._command_handlers["help"] = self._show_help
+        # Start listing languages now, so the subprocess overlaps XDL parsing and dialog creation
+        self._langs_future = None if PYTESSERACT_LANGUAGES else _DEPS_EXECUTOR.submit(_load_tesseract_languages, ctx)
+
+    def _create_dialog(self, parent_frame):
+        """Creates the dialog only if OCR prerequisites are met; otherwise points the user to Settings."""
+        self.parent_frame = parent_frame
+        if not self._check_prerequisites():
+            return False
+        return super()._create_dialog(parent_frame)
+
+    def _check_prerequisites(self):
+        """Returns True if a Tesseract executable can be found, looking where OCR itself does
+        (configured path, PATH, common install directories). Cheap enough for the UI thread."""
+        tess_path_cfg = uno_utils.get_setting(constants.CFG_KEY_TESSERACT_PATH, constants.DEFAULT_TESSERACT_PATH, self.ctx)
+        if _find_tess_cached(tess_path_cfg):
+            return True
+        logger.warning("OptionsDialogHandler: Tesseract not available, not creating OCR Options dialog.")
+        uno_utils.show_message_box(
+            "Tesseract Not Available",
+            "Tesseract OCR was not found.\n\nOpen TejOCR Settings to check dependencies and configure the Tesseract path.",
+            "errorbox",
+            parent_frame=self.parent_frame,
+            ctx=self.ctx
+        )
+        return False
 
     def _init_controls(self):
         """Initialize controls and attach listeners for the Options dialog."""
         logger.info(f"OptionsDialogHandler: _init_controls called for source type: {self.ocr_source_type}")
         
         # Attach button listeners
-        self._add_listener_to_control("RunOCRButton", "run_ocr") 
-        self._add_listener_to_control("CancelButton", "cancel")
-        self._add_listener_to_control("HelpButton", "help")
-        self._add_listener_to_control("RefreshLanguagesButton", "refresh_languages")
+        self._add_button_listeners()
+        
+        # Track output mode changes as they happen instead of polling radios on OK
+        for control_id in self._CONTROL_TO_OUTPUT_MODE:
+            self._add_item_listener_to_control(control_id)
         
-        # Initialize dialog content
+        # Fresh dialog: dropdowns are empty and no output radio has been set yet
+        self._keys.clear()
+        self._current_output_mode = None
+        for control_id in self._LAZY_DROPDOWNS:
+            control = self.get_control(control_id)
+            if control:
+                control.addFocusListener(_PopulateOnFocusListener(self._populate_lazy_dropdown, control_id))
+        
+        self._reload_controls()
+
+    def _reload_controls(self):
+        """Fill the dialog content; also used when the dialog is reopened."""
+        self._loaded_settings = uno_utils.get_settings_batch(self._LOAD_SETTING_DEFAULTS, self.ctx)
+        run_button = self.get_control("RunOCRButton")
+        if run_button:
+            run_button.setEnable(True)
         self._setup_source_information()
         self._load_default_settings()
         self._populate_dropdowns()
@@ -225,16 +748,13 @@ class OptionsDialogHandler(BaseDialogHandler):
 
     def _load_default_settings(self):
         """Load default settings from configuration."""
-        # Load language preference
-        default_lang = uno_utils.get_setting(constants.CFG_KEY_DEFAULT_LANG, constants.DEFAULT_OCR_LANGUAGE, self.ctx)
-        
         # Load output mode preference
-        default_output_mode = uno_utils.get_setting(constants.CFG_KEY_LAST_OUTPUT_MODE, constants.DEFAULT_OUTPUT_MODE, self.ctx)
+        default_output_mode = self._setting(constants.CFG_KEY_LAST_OUTPUT_MODE, constants.DEFAULT_OUTPUT_MODE)
         self._load_output_mode(default_output_mode)
         
         # Load preprocessing defaults
-        default_grayscale = uno_utils.get_setting(constants.CFG_KEY_DEFAULT_GRAYSCALE, constants.DEFAULT_PREPROC_GRAYSCALE, self.ctx)
-        default_binarize = uno_utils.get_setting(constants.CFG_KEY_DEFAULT_BINARIZE, constants.DEFAULT_PREPROC_BINARIZE, self.ctx)
+        default_grayscale = self._setting(constants.CFG_KEY_DEFAULT_GRAYSCALE, constants.DEFAULT_PREPROC_GRAYSCALE)
+        default_binarize = self._setting(constants.CFG_KEY_DEFAULT_BINARIZE, constants.DEFAULT_PREPROC_BINARIZE)
         
         grayscale_cb = self.get_control("GrayscaleCheckbox")
         if grayscale_cb: grayscale_cb.setState(default_grayscale)
@@ -242,16 +762,43 @@ class OptionsDialogHandler(BaseDialogHandler):
         binarize_cb = self.get_control("BinarizeCheckbox")
         if binarize_cb: binarize_cb.setState(default_binarize)
 
+    def _setting(self, key, default_value):
+        """Returns a setting from the batch read at load time, reading it individually if it wasn't part of it."""
+        if key in self._loaded_settings:
+            return self._loaded_settings[key]
+        return uno_utils.get_setting(key, default_value, self.ctx)
+
     def _populate_dropdowns(self):
         """Populate all dropdown controls with available options."""
-        # Populate language dropdown
-        self._populate_languages_dropdown()
-        
-        # Populate PSM dropdown
-        self._populate_psm_dropdown()
+        # Language dropdown: an already filled one (reused dialog) is just reselected, which is cheap;
+        # otherwise it shows only the stored language until it gets focus
+        if "LanguageDropdown" in self._keys:
+            self._populate_languages_dropdown()
+        else:
+            self._show_stored_language()
         
-        # Populate OEM dropdown
-        self._populate_oem_dropdown()
+        # PSM and OEM dropdowns are populated on first focus (_populate_lazy_dropdown)
+
+    def _show_stored_language(self):
+        """Puts just the stored language into the unfilled language dropdown, so it shows the right value."""
+        dropdown = self.get_control("LanguageDropdown")
+        if not dropdown:
+            return
+        stored = str(self._setting(constants.CFG_KEY_LAST_SELECTED_LANG, constants.DEFAULT_OCR_LANGUAGE))
+        dropdown.getModel().removeAllItems()
+        dropdown.addItem(LANG_CODE_TO_NAME.get(stored, stored), 0)
+        dropdown.selectItemPos(0, True)
+
+    def _populate_lazy_dropdown(self, control_name):
+        """Populates a _LAZY_DROPDOWNS dropdown once; later focus events find it already filled."""
+        if control_name in self._keys:
+            return
+        if control_name == "LanguageDropdown":
+            self._populate_languages_dropdown()
+        elif control_name == "PSMDropdown":
+            self._populate_psm_dropdown()
+        elif control_name == "OEMDropdown":
+            self._populate_oem_dropdown()
 
     def _enable_disable_controls(self):
         """Enable/disable controls based on context."""
@@ -266,179 +813,157 @@ class OptionsDialogHandler(BaseDialogHandler):
             if cursor_radio:
                 cursor_radio.setState(True)
                 replace_radio.setState(False)
+                self._current_output_mode = constants.OUTPUT_MODE_CURSOR
 
     def _load_output_mode(self, default_mode=None):
         """Load output mode selection."""
         if default_mode is None:
             default_mode = uno_utils.get_setting(constants.CFG_KEY_LAST_OUTPUT_MODE, constants.DEFAULT_OUTPUT_MODE, self.ctx)
         
-        controls = {
-            constants.OUTPUT_MODE_CURSOR: "OutputAtCursorRadio",
-            constants.OUTPUT_MODE_TEXTBOX: "OutputNewTextboxRadio",
-            constants.OUTPUT_MODE_REPLACE: "OutputReplaceImageRadio",
-            constants.OUTPUT_MODE_CLIPBOARD: "OutputToClipboardRadio"
-        }
-        
-        # Reset all radio buttons first
-        for control_id in controls.values():
-            control = self.get_control(control_id)
-            if control:
-                control.setState(False)
+        controls = self._OUTPUT_MODE_TO_CONTROL
+        mode = default_mode if default_mode in controls else constants.OUTPUT_MODE_CURSOR
         
-        # Set the selected one
-        selected_control_id = controls.get(default_mode, controls[constants.OUTPUT_MODE_CURSOR])
-        selected_control = self.get_control(selected_control_id)
+        # A reused dialog whose radios already show this mode (tracked by itemStateChanged) needs no write
+        if mode == self._current_output_mode:
+            return
+        # Radio buttons in one group clear their siblings, so only the selected one needs setting
+        selected_control = self.get_control(controls[mode])
         if selected_control:
             selected_control.setState(True)
+        self._current_output_mode = mode
 
-    def actionPerformed(self, event):
-        super().actionPerformed(event) # Handles run_ocr, cancel, help (if not overridden)
-        command = event.ActionCommand
-        logger.debug(f"OptionsDialogHandler actionPerformed: {command}")
-        
-        if command == "refresh_languages":
-            self._refresh_languages()
-        elif command == "help":
-            self._show_help()
-        elif command == "run_ocr":
-            # The base class will call _handle_ok_action()
-            pass
+    def itemStateChanged(self, event):
+        """Keeps the cached output mode in sync with the radio button the user clicked."""
+        try:
+            mode = self._CONTROL_TO_OUTPUT_MODE.get(event.Source.getModel().Name)
+        except Exception as e:
+            logger.debug(f"OptionsDialogHandler itemStateChanged: could not resolve source control: {e}")
+            return
+        if mode and event.Selected:
+            self._current_output_mode = mode
 
     def _refresh_languages(self):
         """Refresh the language list."""
-        self.available_languages_map = {}  # Clear cache
-        self._populate_languages_dropdown()
+        changed = False
+        if not self._refresh_too_soon():
+            _, changed = _refresh_tesseract_languages(self.ctx)
+        if changed:
+            self._populate_languages_dropdown()
         status_label = self.get_control("StatusLabel")
         if status_label:
-            status_label.setText("Language list refreshed")
+            status_label.setText("Language list refreshed" if changed else "Language list is up to date")
 
     def _show_help(self):
         """Show help for the OCR Options dialog."""
-        help_text = f"""{constants.EXTENSION_FULL_NAME} - OCR Options Help
-
-LANGUAGE SELECTION:
-• Choose the language of text in your image
-• Correct language selection improves accuracy
-• Use 'Refresh' to update available languages
-
-OUTPUT MODE:
-• Cursor: Insert text at current cursor position
-• Text Box: Create a new text box with the text
-• Replace Image: Replace selected image with text
-• Clipboard: Copy text to system clipboard
-
-ADVANCED OPTIONS:
-• Page Mode: How Tesseract should analyze the image
-• Engine Mode: Which OCR engine to use
-• Preprocessing: Basic image enhancement options
-
-BUTTONS:
-• Start OCR: Begin text recognition
-• Cancel: Close without processing
-• Help: Show this help message"""
+        help_text = _OPTIONS_HELP_TEXT
         
         uno_utils.show_message_box("OCR Options Help", help_text, "infobox", parent_frame=self.parent_frame, ctx=self.ctx)
 
     def _handle_ok_action(self):
-        """Collect options and perform OCR."""
+        """Collect options and start OCR on a worker thread. The dialog is closed by _finish_ocr."""
         logger.info("OCR Options: Starting OCR process...")
+        if self._ocr_thread and self._ocr_thread.is_alive():
+            return self.OK_PENDING  # Already running
         
+        status_label = self.get_control("StatusLabel")
         try:
             # Collect all selected options
             self._collect_selected_options()
-            
-            # Update status
-            status_label = self.get_control("StatusLabel")
-            if status_label: 
-                status_label.setText("Starting OCR processing...")
-            
-            # Perform OCR based on source type
-            if self.ocr_source_type == "file":
-                result = self._perform_file_ocr()
-            elif self.ocr_source_type == "selected":
-                result = self._perform_selected_image_ocr()
-            else:
+            if self.ocr_source_type not in ("file", "selected"):
                 raise ValueError(f"Unknown OCR source type: {self.ocr_source_type}")
-            
-            if result:
-                self.recognized_text = result
-                if status_label: 
-                    status_label.setText(f"OCR completed! Found {len(result)} characters")
-                
-                # Process the output according to selected mode
-                self._handle_output()
-                return True  # Success - close dialog
-            else:
-                if status_label: 
-                    status_label.setText("OCR failed or no text found")
-                return False  # Keep dialog open
-                
         except Exception as e:
             logger.error(f"Error in OCR options dialog: {e}", exc_info=True)
-            status_label = self.get_control("StatusLabel")
             if status_label: 
                 status_label.setText("Error during OCR processing")
             uno_utils.show_message_box("OCR Error", f"OCR processing failed: {e}", "errorbox", parent_frame=self.parent_frame, ctx=self.ctx)
             return False  # Keep dialog open
-
-    def _collect_selected_options(self):
-        """Collect all user-selected options."""
-        self.selected_options = {}
         
-        # Language
-        lang_dropdown = self.get_control("LanguageDropdown")
-        if lang_dropdown and lang_dropdown.getItemCount() > 0:
-            selected_lang_display = lang_dropdown.getSelectedItem()
-            # Map display name back to code
-            inverted_lang_map = {v: k for k, v in self.available_languages_map.items()}
-            self.selected_options["lang"] = inverted_lang_map.get(selected_lang_display, constants.DEFAULT_OCR_LANGUAGE)
-        else:
-            self.selected_options["lang"] = constants.DEFAULT_OCR_LANGUAGE
+        if status_label: 
+            status_label.setText("Processing…")
+        run_button = self.get_control("RunOCRButton")
+        if run_button:
+            run_button.setEnable(False)
         
-        # Output Mode
-        output_modes_map = {
-            "OutputAtCursorRadio": constants.OUTPUT_MODE_CURSOR,
-            "OutputNewTextboxRadio": constants.OUTPUT_MODE_TEXTBOX,
-            "OutputReplaceImageRadio": constants.OUTPUT_MODE_REPLACE,
-            "OutputToClipboardRadio": constants.OUTPUT_MODE_CLIPBOARD
-        }
+        self._ocr_run_id += 1
+        self._ocr_thread = threading.Thread(target=self._run_ocr_worker, args=(self._ocr_run_id,), name="TejOCRWorker", daemon=True)
+        self._ocr_thread.start()
+        return self.OK_PENDING  # Keep dialog open until the worker reports back
+
+    def _run_ocr_worker(self, run_id):
+        """Runs the OCR call off the UI thread and hands the outcome back to it."""
+        result, error = None, None
+        try:
+            # Perform OCR based on source type
+            if self.ocr_source_type == "file":
+                result = self._perform_file_ocr()
+            else:
+                result = self._perform_selected_image_ocr()
+        except Exception as e:
+            logger.error(f"Error in OCR worker: {e}", exc_info=True)
+            error = e
+        uno_utils.run_in_main_thread(lambda: self._finish_ocr(run_id, result, error), self.ctx)
+
+    def _finish_ocr(self, run_id, result, error):
+        """Applies the OCR outcome on the UI thread: outputs the text and closes, or reports the failure.
+        Results from a cancelled run are dropped, even if the dialog has since been reopened."""
+        if run_id != self._ocr_run_id or not self.dialog:
+            logger.info("OCR finished after the dialog was cancelled; discarding result.")
+            return
+        status_label = self.get_control("StatusLabel")
+        run_button = self.get_control("RunOCRButton")
         
-        self.selected_options["output_mode"] = constants.DEFAULT_OUTPUT_MODE
-        for control_id, mode_value in output_modes_map.items():
-            control = self.get_control(control_id)
-            if control and control.getState():
-                self.selected_options["output_mode"] = mode_value
-                break
+        if error is not None:
+            if status_label: 
+                status_label.setText("Error during OCR processing")
+            if run_button:
+                run_button.setEnable(True)
+            uno_utils.show_message_box("OCR Error", f"OCR processing failed: {error}", "errorbox", parent_frame=self.parent_frame, ctx=self.ctx)
+            return
         
-        # PSM (Page Segmentation Mode)
-        psm_dropdown = self.get_control("PSMDropdown")
-        if psm_dropdown and psm_dropdown.getItemCount() > 0:
-            selected_psm_display = psm_dropdown.getSelectedItem()
-            inverted_psm_map = {v: k for k, v in constants.TESSERACT_PSM_MODES.items()}
-            self.selected_options["psm"] = inverted_psm_map.get(selected_psm_display, constants.DEFAULT_PSM_MODE)
-        else:
-            self.selected_options["psm"] = constants.DEFAULT_PSM_MODE
-
-        # OEM (OCR Engine Mode)
-        oem_dropdown = self.get_control("OEMDropdown")
-        if oem_dropdown and oem_dropdown.getItemCount() > 0:
-            selected_oem_display = oem_dropdown.getSelectedItem()
-            inverted_oem_map = {v: k for k, v in constants.TESSERACT_OEM_MODES.items()}
-            self.selected_options["oem"] = inverted_oem_map.get(selected_oem_display, constants.DEFAULT_OEM_MODE)
+        if result:
+            self.recognized_text = result
+            if status_label: 
+                status_label.setText(f"OCR completed! Found {len(result)} characters")
+            
+            # Process the output according to selected mode
+            self._handle_output()
+            self.closed_by_ok = True
+            self.dialog.endExecute()
         else:
-            self.selected_options["oem"] = constants.DEFAULT_OEM_MODE
+            if status_label: 
+                status_label.setText("OCR failed or no text found")
+            if run_button:
+                run_button.setEnable(True)
 
-        # Preprocessing
-        grayscale_cb = self.get_control("GrayscaleCheckbox")
-        binarize_cb = self.get_control("BinarizeCheckbox")
-        
-        self.selected_options["grayscale"] = bool(grayscale_cb.getState() if grayscale_cb else False)
-        self.selected_options["binarize"] = bool(binarize_cb.getState() if binarize_cb else False)
+    def _handle_cancel_action(self):
+        """A running OCR worker can't be interrupted; make sure its result is dropped."""
+        self._ocr_run_id += 1
+        self._ocr_thread = None # A reopened dialog may start a new run while this one finishes
+
+    def _collect_selected_options(self):
+        """Collect all user-selected options."""
+        # Built as one literal with all keys rather than grown key by key
+        self.selected_options = {
+            # Language
+            "lang": self._get_selected_dropdown_key("LanguageDropdown", self._setting(constants.CFG_KEY_LAST_SELECTED_LANG, constants.DEFAULT_OCR_LANGUAGE)),
+            # Output Mode (tracked by itemStateChanged, no need to query the radios)
+            "output_mode": self._current_output_mode or constants.DEFAULT_OUTPUT_MODE,
+            # PSM/OEM; like the language, an unpopulated (never focused) dropdown gives the stored value it would have shown
+            "psm": self._get_selected_dropdown_key("PSMDropdown", self._setting("LastPSMMode", constants.DEFAULT_PSM_MODE)),
+            "oem": self._get_selected_dropdown_key("OEMDropdown", self._setting("LastOEMMode", constants.DEFAULT_OEM_MODE)),
+            # Preprocessing
+            "grayscale": self._state("GrayscaleCheckbox"),
+            "binarize": self._state("BinarizeCheckbox"),
+        }
 
         logger.info(f"Collected OCR options: {self.selected_options}")
         
-        # Save last used options for next time
-        uno_utils.set_setting(constants.CFG_KEY_LAST_OUTPUT_MODE, self.selected_options["output_mode"], self.ctx)
+        # Save last used options for next time; only those that differ from what was loaded, in one write
+        changed = {key: self.selected_options[option] for option, key in self._LAST_USED_KEYS.items()
+                   if str(self.selected_options[option]) != str(self._setting(key, None))}
+        if changed:
+            uno_utils.set_settings_batch(changed, self.ctx)
+            self._loaded_settings.update(changed)
 
     def _perform_file_ocr(self):
         """Perform OCR on a file."""
@@ -496,101 +1021,155 @@ BUTTONS:
         logger.info(f"Text output handled with mode: {output_mode}")
 
     def _populate_languages_dropdown(self):
-        langs = self._get_tesseract_languages()
-        self.available_languages_map = langs # Store for retrieval in _handle_ok_action
-        self._populate_dropdown("LanguageDropdown", langs, constants.CFG_KEY_LAST_SELECTED_LANG, constants.DEFAULT_OCR_LANGUAGE)
+        future, self._langs_future = self._langs_future, None
+        if future is not None and not future.done():
+            try:
+                future.result(timeout=2.0)
+            except concurrent.futures.TimeoutError:
+                # Show the fallback list now and swap in the real one once the background load finishes
+                logger.info("Tesseract languages still loading, showing the fallback list for now.")
+                future.add_done_callback(lambda _: uno_utils.run_in_main_thread(self._finish_languages_load, self.ctx))
+                self._populate_dropdown("LanguageDropdown", _FALLBACK_LANGS, constants.CFG_KEY_LAST_SELECTED_LANG, constants.DEFAULT_OCR_LANGUAGE)
+                return
+        langs = _load_tesseract_languages(self.ctx)
+        self._populate_dropdown("LanguageDropdown", langs, constants.CFG_KEY_LAST_SELECTED_LANG, constants.DEFAULT_OCR_LANGUAGE,
+                                PYTESSERACT_LANG_KEYS, PYTESSERACT_LANG_LABELS)
+
+    def _finish_languages_load(self):
+        """Main-thread end of a background language load that outlasted the dialog opening."""
+        if self.dialog:
+            self._populate_languages_dropdown()
 
     def _populate_psm_dropdown(self):
-        self._populate_dropdown("PSMDropdown", constants.TESSERACT_PSM_MODES, "LastPSMMode", constants.DEFAULT_PSM_MODE)
+        self._populate_dropdown("PSMDropdown", constants.TESSERACT_PSM_MODES, "LastPSMMode", constants.DEFAULT_PSM_MODE,
+                                self._PSM_KEYS, self._PSM_LABELS)
 
     def _populate_oem_dropdown(self):
-        self._populate_dropdown("OEMDropdown", constants.TESSERACT_OEM_MODES, "LastOEMMode", constants.DEFAULT_OEM_MODE)
+        self._populate_dropdown("OEMDropdown", constants.TESSERACT_OEM_MODES, "LastOEMMode", constants.DEFAULT_OEM_MODE,
+                                self._OEM_KEYS, self._OEM_LABELS)
 
-    def _populate_dropdown(self, control_name, items_map, current_value_key, default_value):
+    def _populate_dropdown(self, control_name, items_map, current_value_key, default_value, item_keys=None, item_labels=None):
         dropdown = self.get_control(control_name)
         if not dropdown: return
 
-        stored_value = uno_utils.get_setting(current_value_key, default_value, self.ctx)
-        dropdown.getModel().removeAllItems()
+        stored_value = self._setting(current_value_key, default_value)
+        if item_keys is None:
+            item_keys = tuple(items_map) # Keep order for mapping position to key
+        # A reopened dialog usually already holds these exact items; then only the selection is reset
+        if self._keys.get(control_name) != item_keys:
+            self._key_pos[control_name] = {str(key): i for i, key in enumerate(item_keys)}
+            if item_labels is None:
+                item_labels = tuple(items_map[key] for key in item_keys)
+            dropdown.getModel().removeAllItems()
+            # One addItems call crosses the UNO bridge once instead of once per item
+            dropdown.addItems(item_labels, 0)
+        selected_pos = self._key_pos[control_name].get(str(stored_value), 0)
         
-        selected_pos = 0
-        item_keys = list(items_map.keys()) # Keep order for mapping position to key
-
-        for i, key in enumerate(item_keys):
-            display_text = items_map[key]
-            dropdown.addItem(display_text, i)
-            if str(key) == str(stored_value):
-                selected_pos = i
-        
-        if dropdown.getItemCount() > 0:
+        if item_keys:
             dropdown.selectItemPos(selected_pos, True)
-        self.available_languages_map = items_map # Store for retrieval
+        self._keys[control_name] = item_keys
 
-    def _get_tesseract_languages(self):
-        global PYTESSERACT_LANGUAGES
-        if PYTESSERACT_AVAILABLE and not PYTESSERACT_LANGUAGES:
-            try:
-                tess_path_cfg = uno_utils.get_setting(constants.CFG_KEY_TESSERACT_PATH, constants.DEFAULT_TESSERACT_PATH, self.ctx)
-                tess_exec = uno_utils.find_tesseract_executable(tess_path_cfg, self.ctx)
-                
-                if tess_exec:
-                    # Temporarily set tesseract_cmd for get_languages, then revert
-                    original_cmd = pytesseract.pytesseract.tesseract_cmd
-                    pytesseract.pytesseract.tesseract_cmd = tess_exec
-                    try:
-                        langs = pytesseract.get_languages(config="--list-langs") # some versions might need config
-                        PYTESSERACT_LANGUAGES = {code: LANG_CODE_TO_NAME.get(code, code) for code in sorted(list(set(langs)))}
-                    except Exception as e:
-                        logger.warning(f"Pytesseract get_languages error: {e}. Falling back.", exc_info=True)
-                        PYTESSERACT_LANGUAGES = {k: v for k, v in LANG_CODE_TO_NAME.items()} # Fallback
-                    finally:
-                        pytesseract.pytesseract.tesseract_cmd = original_cmd # Restore
-                else:
-                    PYTESSERACT_LANGUAGES = {k: v for k, v in LANG_CODE_TO_NAME.items()} # Fallback
-            except Exception as e:
-                logger.error(f"Error getting Tesseract languages: {e}", exc_info=True)
-                PYTESSERACT_LANGUAGES = {k: v for k, v in LANG_CODE_TO_NAME.items()} # Fallback on any error
-        elif not PYTESSERACT_LANGUAGES: # If pytesseract wasn't available or already tried and failed
-             logger.info("Pytesseract not available or languages not fetched, using fallback list.")
-             PYTESSERACT_LANGUAGES = {k: v for k, v in LANG_CODE_TO_NAME.items()} # Fallback
-        return PYTESSERACT_LANGUAGES
+    def _get_selected_dropdown_key(self, control_name, default_value):
+        """Returns the key of the selected dropdown item by position, or default_value if nothing is selected."""
+        dropdown = self.get_control(control_name)
+        keys = self._keys.get(control_name)
+        if not dropdown or not keys:
+            return default_value
+        pos = dropdown.getSelectedItemPos()
+        return keys[pos] if 0 <= pos < len(keys) else default_value
 
 # --- Settings Dialog Handler ---
 class SettingsDialogHandler(BaseDialogHandler):
+    _BUTTONS = (
+        ("SaveButton", "save_settings"),
+        ("CancelButton", "cancel"),
+        ("HelpButtonSettings", "help"),
+        ("BrowseButton", "browse_tesseract_path"),
+        ("TestTesseractButton", "test_tesseract"),
+        ("RefreshLanguagesButtonSettings", "refresh_languages_settings"),
+        ("CheckDependenciesButton", "check_dependencies"),
+        ("InstallGuideButton", "install_guide"),
+    )
+    _settings_code_by_index = () # Language codes in dropdown order, recorded when the dropdown is populated
+    # Settings read straight off a bound control: key -> (control attribute, getter)
+    _VALUE_CONTROLS = {
+        constants.CFG_KEY_TESSERACT_PATH: ("_ctl_tess_path", "getText"),
+        constants.CFG_KEY_DEFAULT_GRAYSCALE: ("_ctl_gray", "getState"),
+        constants.CFG_KEY_DEFAULT_BINARIZE: ("_ctl_bin", "getState"),
+    }
+
     def __init__(self, ctx):
-        # Use the standard private:dialogs/ scheme that LibreOffice recognizes for extension XDL files
-        dialog_url = "private:dialogs/tejocr_settings_dialog.xdl"
-        super().__init__(ctx, dialog_url)
+        super().__init__(ctx, _SETTINGS_DIALOG_URL)
         self.initial_settings = {} # To store settings when dialog opens to check for changes
-        self.available_languages_map_settings = {} # Separate map for settings dialog
         self.dependency_status = None # Cache dependency check results
+        self._dirty = set() # Settings keys whose controls were edited since load
+        self._tess_check_cache = {} # path -> (is_valid, message) from check_tesseract_path
+        self._test_timer = None # Pending debounced path test, see _schedule_path_test
+        self._last_browse_dir = None # Directory the file picker last opened in, and its URL
+        self._last_browse_dir_url = None
+        self._command_handlers.update({
+            "browse_tesseract_path": self._browse_tesseract_path,
+            "test_tesseract": functools.partial(self._test_tesseract_path, force=True), # Explicit re-test, e.g. after installing Tesseract
+            "refresh_languages_settings": self._refresh_languages,
+            "check_dependencies": self._on_check_dependencies,
+            "install_guide": self._show_installation_guide,
+        })
 
     def _init_controls(self):
         """Initialize controls and attach listeners for the Settings dialog."""
         logger.info("SettingsDialogHandler: _init_controls called.")
+        self._bind_controls()
         
         # Attach button listeners
-        self._add_listener_to_control("SaveButton", "save_settings") 
-        self._add_listener_to_control("CancelButton", "cancel")
-        self._add_listener_to_control("HelpButtonSettings", "help")
-        self._add_listener_to_control("BrowseButton", "browse_tesseract_path")
-        self._add_listener_to_control("TestTesseractButton", "test_tesseract")
-        self._add_listener_to_control("RefreshLanguagesButtonSettings", "refresh_languages_settings")
-        self._add_listener_to_control("CheckDependenciesButton", "check_dependencies")
-        self._add_listener_to_control("InstallGuideButton", "install_guide")
+        self._add_button_listeners()
         
-        # Load current settings and check dependencies
+        self._reload_controls()
+
+    def _reload_controls(self):
+        """Load current settings and check dependencies; also used when the dialog is reopened."""
         self._load_settings()
         self._check_and_display_dependencies()
 
-    def _check_and_display_dependencies(self):
-        """Check all dependencies and update the status labels."""
+    def _bind_controls(self):
+        """Resolves the controls used on load/save once, instead of looking them up by name per access."""
+        self._ctl_tess_path = self.get_control("TesseractPathTextField")
+        self._ctl_lang_dd = self.get_control("DefaultLanguageDropdown")
+        self._ctl_gray = self.get_control("DefaultGrayscaleCheckbox")
+        self._ctl_bin = self.get_control("DefaultBinarizeCheckbox")
+        self._ctl_status = self.get_control("SettingsStatusLabel")
+        self._ctl_test_status = self.get_control("TesseractTestStatusLabel")
+
+        # Track which settings the user edits so saving only touches those
+        if self._ctl_tess_path:
+            self._ctl_tess_path.addTextListener(_DirtyKeyListener(self._dirty, constants.CFG_KEY_TESSERACT_PATH))
+        for control, key in ((self._ctl_lang_dd, constants.CFG_KEY_DEFAULT_LANG),
+                             (self._ctl_gray, constants.CFG_KEY_DEFAULT_GRAYSCALE),
+                             (self._ctl_bin, constants.CFG_KEY_DEFAULT_BINARIZE)):
+            if control:
+                control.addItemListener(_DirtyKeyListener(self._dirty, key))
+
+    def _check_and_display_dependencies(self, force=False):
+        """Check all dependencies off the UI thread and update the status labels when done."""
         logger.info("Checking dependencies for Settings dialog...")
         
+        tesseract_label = self.get_control("TesseractStatusLabel")
+        if tesseract_label:
+            tesseract_label.setText("⏳ Tesseract: Checking…")
+        packages_label = self.get_control("PythonPackagesStatusLabel")
+        if packages_label:
+            packages_label.setText("⏳ Python: Checking…")
+        
+        future = _DEPS_EXECUTOR.submit(_check_dependencies, force)
+        future.add_done_callback(
+            lambda f: uno_utils.run_in_main_thread(lambda: self._display_dependencies(f), self.ctx))
+
+    def _display_dependencies(self, future):
+        """Fills the dependency status labels from a finished _check_dependencies future (UI thread)."""
+        if not self.dialog:
+            return # Dialog closed while the check was running
+        
         try:
-            # Import dependency checking function from dialogs module
-            from . import tejocr_dialogs
-            self.dependency_status = tejocr_dialogs._check_dependencies()
+            self.dependency_status = future.result()
             
             # Update Tesseract status
             tesseract_label = self.get_control("TesseractStatusLabel")
@@ -626,80 +1205,89 @@ class SettingsDialogHandler(BaseDialogHandler):
 
     def _load_settings(self):
         """Load settings from config and populate dialog controls."""
+        values = uno_utils.get_settings_batch({
+            constants.CFG_KEY_TESSERACT_PATH: "",
+            constants.CFG_KEY_DEFAULT_LANG: constants.DEFAULT_OCR_LANGUAGE,
+            constants.CFG_KEY_DEFAULT_GRAYSCALE: constants.DEFAULT_PREPROC_GRAYSCALE,
+            constants.CFG_KEY_DEFAULT_BINARIZE: constants.DEFAULT_PREPROC_BINARIZE,
+        }, self.ctx)
+        
         # Tesseract Path
-        tesseract_path = uno_utils.get_setting(constants.CFG_KEY_TESSERACT_PATH, "", self.ctx)
-        path_field = self.get_control("TesseractPathTextField")
+        tesseract_path = values[constants.CFG_KEY_TESSERACT_PATH]
+        path_field = self._ctl_tess_path
         if path_field: 
             path_field.setText(tesseract_path)
         self.initial_settings[constants.CFG_KEY_TESSERACT_PATH] = tesseract_path
 
-        # Default Language
-        langs = self._get_tesseract_languages_for_settings()
-        self._populate_dropdown_settings("DefaultLanguageDropdown", langs, constants.CFG_KEY_DEFAULT_LANG, constants.DEFAULT_OCR_LANGUAGE)
-        current_default_lang = uno_utils.get_setting(constants.CFG_KEY_DEFAULT_LANG, constants.DEFAULT_OCR_LANGUAGE, self.ctx)
-        self.initial_settings[constants.CFG_KEY_DEFAULT_LANG] = current_default_lang
+        # Default Language; listing languages may spawn tesseract, so unless the list is already
+        # in memory it is loaded on a worker thread and the dropdown filled when it arrives
+        self.initial_settings[constants.CFG_KEY_DEFAULT_LANG] = values[constants.CFG_KEY_DEFAULT_LANG]
+        if PYTESSERACT_LANGUAGES:
+            self._apply_languages(PYTESSERACT_LANGUAGES)
+        else:
+            self._settings_code_by_index = ()
+            lang_dropdown = self._ctl_lang_dd
+            if lang_dropdown:
+                lang_dropdown.getModel().removeAllItems()
+                lang_dropdown.addItem("Loading…", 0)
+                lang_dropdown.selectItemPos(0, True)
+                lang_dropdown.setEnable(False)
+            # Same executor as the Options dialog prefetch, so the two never list languages in parallel
+            _DEPS_EXECUTOR.submit(self._load_languages_async)
 
         # Default Preprocessing
-        grayscale = uno_utils.get_setting(constants.CFG_KEY_DEFAULT_GRAYSCALE, constants.DEFAULT_PREPROC_GRAYSCALE, self.ctx)
-        binarize = uno_utils.get_setting(constants.CFG_KEY_DEFAULT_BINARIZE, constants.DEFAULT_PREPROC_BINARIZE, self.ctx)
-        cb_gray = self.get_control("DefaultGrayscaleCheckbox")
+        grayscale = values[constants.CFG_KEY_DEFAULT_GRAYSCALE]
+        binarize = values[constants.CFG_KEY_DEFAULT_BINARIZE]
+        cb_gray = self._ctl_gray
         if cb_gray: cb_gray.setState(grayscale)
-        cb_bin = self.get_control("DefaultBinarizeCheckbox")
+        cb_bin = self._ctl_bin
         if cb_bin: cb_bin.setState(binarize)
         self.initial_settings[constants.CFG_KEY_DEFAULT_GRAYSCALE] = grayscale
         self.initial_settings[constants.CFG_KEY_DEFAULT_BINARIZE] = binarize
         
-        status_label = self.get_control("SettingsStatusLabel")
+        # Programmatic setText above fires textChanged; only user edits should count
+        self._dirty.clear()
+        
+        status_label = self._ctl_status
         if status_label: status_label.setText("Settings loaded successfully")
 
-    def _get_tesseract_languages_for_settings(self):
-        # This is similar to _get_tesseract_languages in OptionsDialogHandler
-        # but kept separate to manage its own potential cache or state if needed.
-        # For now, it can reuse the global PYTESSERACT_LANGUAGES for simplicity, but ideally, it should be independent.
-        # Let's assume for now it can use a fresh call or a short-lived cache.
-        cached_langs = getattr(self, "_settings_languages_cache", None)
-        if PYTESSERACT_AVAILABLE and not cached_langs:
-            try:
-                tess_path_cfg = uno_utils.get_setting(constants.CFG_KEY_TESSERACT_PATH, constants.DEFAULT_TESSERACT_PATH, self.ctx)
-                tess_exec = uno_utils.find_tesseract_executable(tess_path_cfg, self.ctx)
-                if tess_exec:
-                    original_cmd = pytesseract.pytesseract.tesseract_cmd
-                    pytesseract.pytesseract.tesseract_cmd = tess_exec
-                    try:
-                        langs = pytesseract.get_languages(config="--list-langs")
-                        cached_langs = {code: LANG_CODE_TO_NAME.get(code, code) for code in sorted(list(set(langs)))}
-                    except Exception as e:
-                        logger.warning(f"SettingsDialog: Pytesseract get_languages error: {e}. Falling back.", exc_info=True)
-                        cached_langs = {k: v for k, v in LANG_CODE_TO_NAME.items()}
-                    finally:
-                        pytesseract.pytesseract.tesseract_cmd = original_cmd
-                else:
-                    cached_langs = {k: v for k, v in LANG_CODE_TO_NAME.items()}
-            except Exception as e:
-                logger.error(f"SettingsDialog: Error getting Tesseract languages: {e}", exc_info=True)
-                cached_langs = {k: v for k, v in LANG_CODE_TO_NAME.items()}
-        elif not cached_langs:
-             logger.info("SettingsDialog: Pytesseract not available or languages not fetched, using fallback list.")
-             cached_langs = {k: v for k, v in LANG_CODE_TO_NAME.items()}
-        self._settings_languages_cache = cached_langs
-        return self._settings_languages_cache
-
-    def _populate_dropdown_settings(self, control_name, items_map, current_value_key, default_value):
+    def _load_languages_async(self):
+        """Runs on _DEPS_EXECUTOR: loads the language list, then fills the dropdown on the main thread."""
+        langs = _load_tesseract_languages(self.ctx)
+        uno_utils.run_in_main_thread(functools.partial(self._finish_languages_load, langs), self.ctx)
+
+    def _finish_languages_load(self, langs):
+        """Main-thread end of _load_languages_async; skipped if the dialog went away in the meantime."""
+        if self.dialog:
+            self._apply_languages(langs)
+
+    def _apply_languages(self, langs):
+        """Fills the default language dropdown from langs, selecting the stored default."""
+        current_default_lang = self.initial_settings.get(constants.CFG_KEY_DEFAULT_LANG)
+        self._settings_code_by_index = tuple(langs)
+        self._populate_dropdown_settings("DefaultLanguageDropdown", langs, constants.CFG_KEY_DEFAULT_LANG, constants.DEFAULT_OCR_LANGUAGE, stored_value=current_default_lang)
+        if self._ctl_lang_dd:
+            self._ctl_lang_dd.setEnable(True)
+        # Filling the dropdown is not a user edit
+        self._dirty.discard(constants.CFG_KEY_DEFAULT_LANG)
+
+    def _populate_dropdown_settings(self, control_name, items_map, current_value_key, default_value, stored_value=None):
         dropdown = self.get_control(control_name)
         if not dropdown: return
 
-        stored_value = uno_utils.get_setting(current_value_key, default_value, self.ctx)
+        if stored_value is None:
+            stored_value = uno_utils.get_setting(current_value_key, default_value, self.ctx)
         dropdown.getModel().removeAllItems()
         
         selected_pos = 0
         # Ensure items_map is not None and is a dictionary
-        if items_map and isinstance(items_map, dict):
-            item_keys = list(items_map.keys()) 
-            for i, key in enumerate(item_keys):
-                display_text = items_map[key]
-                dropdown.addItem(display_text, i)
-                if str(key) == str(stored_value):
-                    selected_pos = i
+        if items_map and isinstance(items_map, Mapping):
+            # One addItems call crosses the UNO bridge once instead of once per language
+            dropdown.addItems(tuple(items_map.values()), 0)
+            try:
+                selected_pos = list(items_map.keys()).index(str(stored_value))
+            except ValueError:
+                selected_pos = 0
             
             if dropdown.getItemCount() > 0:
                 dropdown.selectItemPos(selected_pos, True)
@@ -709,73 +1297,38 @@ class SettingsDialogHandler(BaseDialogHandler):
             dropdown.addItem("Error: Could not load languages",0)
             dropdown.selectItemPos(0,True)
 
-    def actionPerformed(self, event):
-        super().actionPerformed(event) # Handles save_settings, cancel, help (if not overridden)
-        command = event.ActionCommand
-        logger.debug(f"SettingsDialogHandler actionPerformed: {command}")
-        
-        if command == "browse_tesseract_path":
-            self._browse_tesseract_path()
-        elif command == "test_tesseract":
-            self._test_tesseract_path()
-        elif command == "refresh_languages_settings":
-            self._refresh_languages()
-        elif command == "check_dependencies":
-            self._check_and_display_dependencies()
-            status_label = self.get_control("SettingsStatusLabel")
-            if status_label: 
-                status_label.setText("Dependencies checked")
-        elif command == "install_guide":
-            self._show_installation_guide()
-        elif command == "help":
-            self._handle_help_action()
+    def _on_check_dependencies(self):
+        """Check Dependencies button: re-runs the check, bypassing its cache."""
+        self._check_and_display_dependencies(force=True)
+        status_label = self._ctl_status
+        if status_label: 
+            status_label.setText("Dependencies checked")
 
     def _refresh_languages(self):
         """Refresh the language list by clearing cache and reloading."""
-        self._settings_languages_cache = None # Clear cache
-        langs = self._get_tesseract_languages_for_settings()
+        langs, changed = PYTESSERACT_LANGUAGES, False
+        if not self._refresh_too_soon():
+            langs, changed = _refresh_tesseract_languages(self.ctx)
+        if not changed:
+            uno_utils.show_message_box("Languages Refreshed", "The list of available OCR languages is already up to date.", "infobox", parent_frame=self.parent_frame, ctx=self.ctx)
+            return
+        self._settings_code_by_index = tuple(langs)
         self._populate_dropdown_settings("DefaultLanguageDropdown", langs, constants.CFG_KEY_DEFAULT_LANG, constants.DEFAULT_OCR_LANGUAGE)
         uno_utils.show_message_box("Languages Refreshed", "The list of available OCR languages has been updated.", "infobox", parent_frame=self.parent_frame, ctx=self.ctx)
 
     def _show_installation_guide(self):
         """Show detailed installation guidance for missing dependencies."""
         if not self.dependency_status:
-            self._check_and_display_dependencies()
+            self.dependency_status = _check_dependencies()
         
-        guide_text = f"""TejOCR Installation Guide
-
-{self.dependency_status.get('installation_guide', 'Installation guidance not available')}
-
-For more detailed instructions, visit:
-https://github.com/tesseract-ocr/tesseract/wiki
-
-Need help? Check the TejOCR documentation or contact support."""
+        guide_text = _INSTALL_GUIDE_TEMPLATE.format(
+            installation_guide=self.dependency_status.get('installation_guide', 'Installation guidance not available'))
 
         uno_utils.show_message_box("Installation Guide", guide_text, "infobox", parent_frame=self.parent_frame, ctx=self.ctx)
 
     def _handle_help_action(self):
         """Show help information for the Settings dialog."""
-        help_text = f"""{constants.EXTENSION_FULL_NAME} - Settings Help
-
-DEPENDENCY STATUS:
-• Shows current status of required components
-• Green ✅ means component is working
-• Red ❌ means component needs installation
-
-TESSERACT CONFIGURATION:
-• Set path to Tesseract executable
-• Use 'Browse' to find installation
-• Use 'Test' to verify it works
-
-DEFAULT OPTIONS:
-• Set preferences for OCR operations
-• Language: Default recognition language
-• Preprocessing: Image enhancement options
-
-BUTTONS:
-• Save: Saves settings permanently
-• Cancel: Discards changes
-• Help: Shows this help message"""
+        help_text = _SETTINGS_HELP_TEXT
         
         uno_utils.show_message_box("Settings Help", help_text, "infobox", parent_frame=self.parent_frame, ctx=self.ctx)
 
@@ -791,57 +1344,75 @@ BUTTONS:
             fp.setTitle("Select Tesseract Executable")
             
             # Set filter for executable files (platform-specific)
-            import platform
-            system = platform.system().lower()
+            system = _SYSTEM
             if system == "windows":
                 fp.appendFilter("Executable Files", "*.exe")
                 fp.appendFilter("All Files", "*.*")
             else:
                 fp.appendFilter("All Files", "*")
             
-            # Set default directory (try common installation paths)
-            default_paths = {
-                "darwin": ["/usr/local/bin", "/opt/homebrew/bin", "/usr/bin"],
-                "linux": ["/usr/bin", "/usr/local/bin"],
-                "windows": ["C:\\Program Files\\Tesseract-OCR", "C:\\Program Files (x86)\\Tesseract-OCR"]
-            }
-            
-            for path in default_paths.get(system, []):
-                if os.path.exists(path):
-                    try:
-                        fp.setDisplayDirectory(unohelper.systemPathToFileUrl(path))
-                        break
-                    except:
-                        continue
+            # Start in the configured executable's directory, else the first common installation path
+            # (existence checked at import); with neither, the picker keeps its own default
+            current_path = self._ctl_tess_path.getText().strip() if self._ctl_tess_path else ""
+            browse_dir = os.path.dirname(current_path) if current_path else (_DEFAULT_TESS_DIRS[0] if _DEFAULT_TESS_DIRS else None)
+            if browse_dir:
+                if browse_dir != self._last_browse_dir:
+                    self._last_browse_dir = browse_dir
+                    self._last_browse_dir_url = unohelper.systemPathToFileUrl(browse_dir)
+                try:
+                    fp.setDisplayDirectory(self._last_browse_dir_url)
+                except Exception as e:
+                    logger.debug(f"Could not set file picker directory {browse_dir}: {e}")
             
             # Execute the file picker
             if fp.execute() == 1:  # OK button pressed
                 selected_files = fp.getFiles()
                 if selected_files:
                     selected_path = unohelper.fileUrlToSystemPath(selected_files[0])
-                    path_field = self.get_control("TesseractPathTextField")
+                    path_field = self._ctl_tess_path
                     if path_field:
                         path_field.setText(selected_path)
                         # Auto-test the selected path
-                        self._test_tesseract_path()
+                        self._schedule_path_test(selected_path.strip())
                         
         except Exception as e:
             logger.error(f"Error in browse Tesseract path: {e}", exc_info=True)
             uno_utils.show_message_box("Browse Error", f"Could not open file browser: {e}", "errorbox", parent_frame=self.parent_frame, ctx=self.ctx)
 
-    def _test_tesseract_path(self):
-        """Test the currently entered Tesseract path."""
-        path_field = self.get_control("TesseractPathTextField")
-        if not path_field:
-            return
-            
-        tess_path = path_field.getText().strip()
-        status_label = self.get_control("TesseractTestStatusLabel")
+    def _schedule_path_test(self, path=None, delay=0.25):
+        """Tests the path after a short delay; triggers arriving within it collapse into one test."""
+        if self._test_timer:
+            self._test_timer.cancel()
+        callback = functools.partial(self._run_scheduled_path_test, path)
+        self._test_timer = threading.Timer(delay, uno_utils.run_in_main_thread, (callback, self.ctx))
+        self._test_timer.daemon = True
+        self._test_timer.start()
+
+    def _run_scheduled_path_test(self, path):
+        """Main-thread end of _schedule_path_test; skipped if the dialog went away in the meantime."""
+        self._test_timer = None
+        if self.dialog:
+            self._test_tesseract_path(path)
+
+    def _test_tesseract_path(self, path=None, force=False):
+        """Test the given Tesseract path, or the one currently entered if path is None.
+        Results are remembered per path, since the check spawns tesseract; force=True re-runs it."""
+        if path is None:
+            path_field = self._ctl_tess_path
+            if not path_field:
+                return
+            path = path_field.getText().strip()
+        tess_path = path
+        status_label = self._ctl_test_status
         
         try:
             # Import tejocr_engine for testing
-            from . import tejocr_engine
-            is_valid, message = tejocr_engine.check_tesseract_path(tess_path, self.ctx, show_gui_errors=False)
+            cached = None if force else self._tess_check_cache.get(tess_path)
+            if cached is None:
+                from . import tejocr_engine
+                cached = tejocr_engine.check_tesseract_path(tess_path, self.ctx, show_gui_errors=False)
+                self._tess_check_cache[tess_path] = cached
+            is_valid, message = cached
             
             if status_label:
                 if is_valid:
@@ -865,70 +1436,64 @@ Details: {message}""",
             if status_label:
                 status_label.setText(f"❌ Error: Could not test path")
 
+    def _current_value(self, key):
+        """Returns the value currently shown in the dialog for a settings key, or None if unavailable."""
+        spec = self._VALUE_CONTROLS.get(key)
+        if spec:
+            control_attr, getter = spec
+            control = getattr(self, control_attr)
+            if not control:
+                return None
+            value = getattr(control, getter)()
+            return value.strip() if isinstance(value, str) else value
+        if key == constants.CFG_KEY_DEFAULT_LANG:
+            lang_dropdown = self._ctl_lang_dd
+            if not lang_dropdown:
+                return None
+            # Map the selected position back to its code; saving must never start a Tesseract language probe
+            codes = self._settings_code_by_index
+            if not codes:
+                logger.warning("SettingsDialog: language list not loaded, keeping the stored default language.")
+                return None
+            pos = lang_dropdown.getSelectedItemPos()
+            return codes[pos] if 0 <= pos < len(codes) else None
+        return None
+
     def _handle_ok_action(self):
         """Save settings if they have changed."""
         logger.info("SettingsDialog: Save action initiated.")
         
         try:
-            changes_made = False
+            changes = {}
             
-            # Tesseract Path
-            new_tesseract_path = self.get_control("TesseractPathTextField").getText().strip()
-            if new_tesseract_path != self.initial_settings.get(constants.CFG_KEY_TESSERACT_PATH):
-                logger.info(f"Updating Tesseract path: {new_tesseract_path}")
-                uno_utils.set_setting(constants.CFG_KEY_TESSERACT_PATH, new_tesseract_path, self.ctx)
-                changes_made = True
-
-            # Default Language
-            lang_dropdown = self.get_control("DefaultLanguageDropdown")
-            if lang_dropdown and lang_dropdown.getItemCount() > 0:
-                selected_lang_display = lang_dropdown.getSelectedItem()
-                # Map display name back to code
-                current_langs_map = getattr(self, "_settings_languages_cache", None)
-                if not current_langs_map:
-                     current_langs_map = self._get_tesseract_languages_for_settings()
-
-                selected_lang_code = None
-                for code, display in current_langs_map.items():
-                    if display == selected_lang_display:
-                        selected_lang_code = code
-                        break
-                
-                if selected_lang_code and selected_lang_code != self.initial_settings.get(constants.CFG_KEY_DEFAULT_LANG):
-                    uno_utils.set_setting(constants.CFG_KEY_DEFAULT_LANG, selected_lang_code, self.ctx)
-                    changes_made = True
-
-            # Default Preprocessing
-            grayscale_control = self.get_control("DefaultGrayscaleCheckbox")
-            binarize_control = self.get_control("DefaultBinarizeCheckbox")
+            # Only settings whose controls were edited need to be read back and written
+            for key in tuple(self._dirty):
+                new_value = self._current_value(key)
+                if new_value is None or new_value == self.initial_settings.get(key):
+                    continue
+                logger.info(f"Updating setting {key}: {new_value}")
+                changes[key] = new_value
             
-            if grayscale_control:
-                new_grayscale = grayscale_control.getState()
-                if new_grayscale != self.initial_settings.get(constants.CFG_KEY_DEFAULT_GRAYSCALE):
-                    uno_utils.set_setting(constants.CFG_KEY_DEFAULT_GRAYSCALE, new_grayscale, self.ctx)
-                    changes_made = True
-                    
-            if binarize_control:
-                new_binarize = binarize_control.getState()
-                if new_binarize != self.initial_settings.get(constants.CFG_KEY_DEFAULT_BINARIZE):
-                    uno_utils.set_setting(constants.CFG_KEY_DEFAULT_BINARIZE, new_binarize, self.ctx)
-                    changes_made = True
+            # Nothing to write: the dialog closes right away, so leave the status label alone too
+            if not changes:
+                logger.debug("SettingsDialog: no changes to save.")
+                return True
+            
+            uno_utils.set_settings_batch(changes, self.ctx)
+            if constants.CFG_KEY_TESSERACT_PATH in changes:
+                _find_tess_cached.cache_clear()
             
             # Update status
-            status_label = self.get_control("SettingsStatusLabel")
-            if changes_made:
-                if status_label: 
-                    status_label.setText("Settings saved successfully")
-                logger.info("Settings changes saved successfully")
-            else:
-                if status_label: 
-                    status_label.setText("No changes to save")
+            status_label = self._ctl_status
+            if status_label: 
+                status_label.setText("Settings saved successfully")
+            logger.info("Settings changes saved successfully")
             
             return True  # Settings saved successfully
             
         except Exception as e:
             logger.error(f"Error saving settings: {e}", exc_info=True)
-            status_label = self.get_control("SettingsStatusLabel")
+            status_label = self._ctl_status
             if status_label: 
                 status_label.setText("Error saving settings")
             uno_utils.show_message_box("Save Error", f"Could not save settings: {e}", "errorbox", parent_frame=self.parent_frame, ctx=self.ctx)
@@ -936,11 +1501,50 @@ Details: {message}""",
 
 # --- Global Dialog Functions ---
 
-def _check_dependencies():
-    """Check status of all OCR dependencies and provide user guidance."""
-    import subprocess
-    import sys
-    import os
+@functools.lru_cache(maxsize=1)
+def _probe_python_packages():
+    """Returns {module_name: version or None if missing} for numpy, PIL and uno without importing them.
+    Modules that are already loaded (e.g. numpy by the OCR engine) report their own __version__.
+    Cleared by a forced dependency check."""
+    from importlib import metadata # ~50ms to import; only needed for the dependency check
+    results = {}
+    for module_name, dist_name in (("numpy", "numpy"), ("PIL", "Pillow"), ("uno", None)):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            results[module_name] = getattr(module, "__version__", "")
+            continue
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None:
+            results[module_name] = None
+            continue
+        try:
+            results[module_name] = metadata.version(dist_name) if dist_name else ""
+        except metadata.PackageNotFoundError:
+            results[module_name] = ""
+    return results
+
+# Dependency checks run here so the UI thread never waits on the Tesseract subprocess
+_DEPS_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="TejOCRDeps")
+
+# Matches the version in the `tesseract --version` line, e.g. "tesseract 5.3.4"
+_TESS_VER_RE = re.compile(r"tesseract\s+v?([0-9][^\s]*)", re.I)
+
+# Dependency check results are reused for a short while; the check spawns Tesseract.
+_DEPS_CACHE_TTL = 30 # seconds
+_DEPS_CACHE = {"ts": 0.0, "status": None}
+
+def _check_dependencies(force=False):
+    """Check status of all OCR dependencies and provide user guidance.
+    Results are cached for _DEPS_CACHE_TTL seconds unless force is True."""
+    if not force and _DEPS_CACHE["status"] is not None and time.monotonic() - _DEPS_CACHE["ts"] < _DEPS_CACHE_TTL:
+        return _DEPS_CACHE["status"]
+    if force:
+        _probe_python_packages.cache_clear()
+        _get_tesseract_version_cached.clear()
+        _find_tess_cached.cache_clear()
     
     status = {
         'summary': '',
@@ -950,72 +1554,76 @@ def _check_dependencies():
         'next_steps': ''
     }
     
-    # Check Tesseract
+    # Check Tesseract; only spawn it when there is a binary to run
     tesseract_status = "❌ NOT FOUND"
     tesseract_path = "Not detected"
-    try:
-        result = subprocess.run(['tesseract', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            version = result.stdout.strip().split()[1] if result.stdout.strip().split() else "Unknown"
-            tesseract_status = f"✅ INSTALLED (v{version})"
-            tesseract_path = "Available in system PATH"
-    except:
-        pass
+    tess_bin = _configured_tesseract()
+    if tess_bin:
+        try:
+            # Shares the probe (and its result) with the Tesseract check dialog; bounded at 1 s there
+            returncode, version_line, _ = _get_tesseract_version_cached(tess_bin)
+            if returncode == 0:
+                match = _TESS_VER_RE.search(version_line)
+                version = match.group(1) if match else "Unknown"
+                tesseract_status = f"✅ INSTALLED (v{version})"
+                tesseract_path = tess_bin
+        except Exception as e:
+            logger.debug(f"Tesseract version probe failed: {e}")
     
     status['tesseract'] = f"Status: {tesseract_status}\nPath: {tesseract_path}"
     
     # Check Python packages with detailed diagnostics
     python_packages = []
     
-    # Check NumPy first since it's required for pytesseract
-    numpy_available = False
+    # Initialize the engine first: it adds LibreOffice's numpy paths to sys.path
+    engine_ok = False
+    engine_error = None
     try:
-        import numpy
-        python_packages.append(f"✅ numpy: {numpy.__version__}")
-        numpy_available = True
-    except ImportError:
+        from tejocr import tejocr_engine
+        engine_ok = tejocr_engine._initialize_pytesseract()
+    except Exception as e:
+        engine_error = e
+    
+    package_versions = _probe_python_packages()
+    
+    # Check NumPy first since it's required for pytesseract
+    numpy_version = package_versions.get("numpy")
+    numpy_available = numpy_version is not None
+    if numpy_available:
+        python_packages.append(f"✅ numpy: {numpy_version or 'version unknown'}")
+    else:
         python_packages.append("❌ numpy: Not found in LibreOffice Python (required for pytesseract)")
-        numpy_available = False
     
     # Check pytesseract using the new engine initialization
     pytesseract_available = False
-    try:
-        from tejocr import tejocr_engine
-        if tejocr_engine._initialize_pytesseract():
-            python_packages.append("✅ pytesseract: Available and working")
-            pytesseract_available = True
-        else:
-            if numpy_available:
-                python_packages.append("❌ pytesseract: Available but not working (check tesseract installation)")
-            else:
-                python_packages.append("❌ pytesseract: Cannot load due to missing numpy")
-            pytesseract_available = False
-    except Exception as e:
-        error_msg = str(e)[:50]
+    if engine_error is not None:
+        error_msg = str(engine_error)[:50]
         if "numpy" in error_msg.lower():
             python_packages.append("❌ pytesseract: Failed due to missing numpy")
         else:
             python_packages.append(f"❌ pytesseract: Error checking - {error_msg}")
-        pytesseract_available = False
+    elif engine_ok:
+        python_packages.append("✅ pytesseract: Available and working")
+        pytesseract_available = True
+    elif numpy_available:
+        python_packages.append("❌ pytesseract: Available but not working (check tesseract installation)")
+    else:
+        python_packages.append("❌ pytesseract: Cannot load due to missing numpy")
     
     # Check PIL/Pillow
-    try:
-        import PIL
-        python_packages.append(f"✅ Pillow: {PIL.__version__}")
-        pillow_available = True
-    except ImportError:
+    pillow_version = package_versions.get("PIL")
+    pillow_available = pillow_version is not None
+    if pillow_available:
+        python_packages.append(f"✅ Pillow: {pillow_version or 'version unknown'}")
+    else:
         python_packages.append("❌ Pillow: Not found in LibreOffice Python")
-        pillow_available = False
     
     # Check UNO - Should always be available in LibreOffice
-    try:
-        import uno
+    uno_available = package_versions.get("uno") is not None
+    if uno_available:
         python_packages.append("✅ uno: Available in LibreOffice")
-        uno_available = True
-    except ImportError:
+    else:
         python_packages.append("❌ uno: Not available (unexpected)")
-        uno_available = False
     
     status['python_packages'] = '\n'.join(python_packages)
     
@@ -1075,55 +1683,10 @@ Your TejOCR extension is ready for full functionality!"""
 See installation guide below for your platform."""
     
     # Platform-specific installation guide
-    import platform
-    system = platform.system().lower()
-    
-    if system == "darwin":  # macOS
-        status['installation_guide'] = """🍎 macOS Installation:
-
-1️⃣ TESSERACT:
-   brew install tesseract
-
-2️⃣ PYTHON PACKAGES:
-   /Applications/LibreOffice.app/Contents/Frameworks/LibreOfficePython.framework/Versions/Current/bin/python3 -m pip install numpy pytesseract pillow
-
-3️⃣ VERIFY:
-   tesseract --version"""
-   
-    elif system == "linux":
-        status['installation_guide'] = """🐧 Linux Installation:
-
-1️⃣ TESSERACT:
-   sudo apt install tesseract-ocr   # Ubuntu/Debian
-   sudo dnf install tesseract       # Fedora
-   sudo pacman -S tesseract         # Arch
-
-2️⃣ PYTHON PACKAGES:
-   pip3 install numpy pytesseract pillow
-
-3️⃣ VERIFY:
-   tesseract --version"""
-   
-    elif system == "windows":
-        status['installation_guide'] = """🪟 Windows Installation:
-
-1️⃣ TESSERACT:
-   Download from: https://github.com/UB-Mannheim/tesseract/wiki
-   Run installer and add to PATH
-
-2️⃣ PYTHON PACKAGES:
-   pip install numpy pytesseract pillow
-
-3️⃣ VERIFY:
-   tesseract --version"""
-   
-    else:
-        status['installation_guide'] = """🖥️ General Installation:
-
-1️⃣ TESSERACT: Install from https://tesseract-ocr.github.io/
-2️⃣ PYTHON PACKAGES: pip install numpy pytesseract pillow
-3️⃣ VERIFY: tesseract --version"""
+    status['installation_guide'] = _INSTALL_GUIDE_BY_SYSTEM.get(_SYSTEM, _INSTALL_GUIDE_BY_SYSTEM[None])
     
+    _DEPS_CACHE["status"] = status
+    _DEPS_CACHE["ts"] = time.monotonic()
     return status
 
 def show_ocr_options_dialog(ctx, parent_frame, ocr_source_type, image_path=None):
@@ -1146,8 +1709,7 @@ def show_ocr_options_dialog(ctx, parent_frame, ocr_source_type, image_path=None)
             if ctx is None:
                 ctx = uno.getComponentContext()
             
-            service_manager = ctx.getServiceManager()
-            toolkit = service_manager.createInstanceWithContext("com.sun.star.awt.Toolkit", ctx)
+            toolkit = _services(ctx)["toolkit"]
             
             if toolkit:
                 # Robust message box creation with multiple fallback methods
@@ -1166,7 +1728,7 @@ def show_ocr_options_dialog(ctx, parent_frame, ocr_source_type, image_path=None)
                 # Method 2: Try desktop's current frame
                 if not parent_peer:
                     try:
-                        desktop = service_manager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+                        desktop = _services(ctx)["desktop"]
                         if desktop:
                             current_frame = desktop.getCurrentFrame()
                             if current_frame:
@@ -1217,19 +1779,43 @@ def show_ocr_options_dialog(ctx, parent_frame, ocr_source_type, image_path=None)
         return None, None
 
 
+# How long the settings summary waits for the background dependency check before showing without it
+_DEPS_WAIT_TIMEOUT = 2.0 # seconds
+_DEPS_PENDING_STATUS = types.MappingProxyType({
+    'summary': "⏳ Checking dependencies… Reopen Settings to see the result.",
+    'tesseract': '',
+    'python_packages': "Checking…",
+    'installation_guide': '',
+    'next_steps': '',
+})
+
+def _dependency_status(future):
+    """Returns the dependency check result, or _DEPS_PENDING_STATUS if it is not ready in time or failed."""
+    try:
+        return future.result(timeout=_DEPS_WAIT_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        logger.info("Dependency check still running; showing settings without its result.")
+    except Exception as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dependency check failed", exc_info=True)
+        else:
+            logger.warning("Dependency check failed: %s", e)
+    return _DEPS_PENDING_STATUS
+
 def show_settings_dialog(ctx, parent_frame):
     """Proper settings dialog with dependency detection and configuration options."""
     
-    # Get dependency status
-    dependency_status = _check_dependencies()
+    # Start the version probe (shared by the dependency check and the Tesseract check dialog) and
+    # the dependency check in the background while the toolkit and parent peer are set up
+    _tesseract_version_future()
+    dependency_future = _DEPS_EXECUTOR.submit(_check_dependencies)
     
     try:
         import uno
         if ctx is None:
             ctx = uno.getComponentContext()
         
-        service_manager = ctx.getServiceManager()
-        toolkit = service_manager.createInstanceWithContext("com.sun.star.awt.Toolkit", ctx)
+        toolkit = _services(ctx)["toolkit"]
         
         if not toolkit:
             logger.warning("Could not create toolkit for settings dialog")
@@ -1245,6 +1831,10 @@ def show_settings_dialog(ctx, parent_frame):
             except Exception as e:
                 logger.debug(f"Could not get parent peer: {e}")
         
+        # The message box text is fixed once shown, so wait (briefly) for the check result here
+        dependency_status = _dependency_status(dependency_future)
+        tesseract_status = dependency_status['tesseract']
+        
         # Create a proper dialog with action buttons
         dialog_text = f"""{constants.EXTENSION_FULL_NAME} - Settings
 
@@ -1253,7 +1843,7 @@ STATUS: Extension installed and active
 DEPENDENCY STATUS:
 {dependency_status['summary']}
 
-TESSERACT: {dependency_status['tesseract'].split('Status: ')[1] if 'Status: ' in dependency_status['tesseract'] else 'Checking...'}
+TESSERACT: {tesseract_status.split('Status: ')[1] if 'Status: ' in tesseract_status else 'Checking...'}
 
 PYTHON PACKAGES:
 {dependency_status['python_packages'].replace('✅ ', '✓ ').replace('❌ ', '✗ ')}
@@ -1267,11 +1857,8 @@ Would you like to:
 • View Full Documentation"""
 
         try:
-            from com.sun.star.awt.MessageBoxType import QUERYBOX
-            from com.sun.star.awt.MessageBoxButtons import BUTTONS_YES_NO_CANCEL
-            
-            msg_type = QUERYBOX
-            buttons = BUTTONS_YES_NO_CANCEL
+            msg_type = _MB_QUERYBOX
+            buttons = _MB_YES_NO_CANCEL
             
             box = toolkit.createMessageBox(parent_peer, msg_type, buttons, 
                                          f"{constants.EXTENSION_FULL_NAME} Settings", 
@@ -1290,106 +1877,208 @@ Would you like to:
                 
                 return True
                 
-        except ImportError:
-            # Fallback to basic info dialog
-            try:
-                msg_type = 3   # Question box
-                buttons = 2    # YES_NO buttons
-                
-                box = toolkit.createMessageBox(parent_peer, msg_type, buttons, 
-                                             f"{constants.EXTENSION_FULL_NAME} Settings", 
-                                             dialog_text)
-                if box:
-                    result = box.execute()
-                    logger.info(f"Settings dialog (fallback) result: {result}")
-                    return True
-                    
-            except Exception as fallback_error:
-                logger.warning(f"Settings dialog fallback failed: {fallback_error}")
+        except Exception as box_error:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Settings message box failed", exc_info=True)
+            else:
+                logger.warning("Settings message box failed: %s", box_error)
                 
     except Exception as e:
-        logger.error(f"Settings dialog error: {e}", exc_info=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Settings dialog error", exc_info=True)
+        else:
+            logger.warning("Settings dialog error: %s", e)
     
     # Console fallback
-    print("=" * 60)
-    print(f"{constants.EXTENSION_FULL_NAME} - Settings")
-    print("=" * 60)
-    print(dependency_status['summary'])
-    print(f"Tesseract: {dependency_status['tesseract']}")
-    print(f"Python Packages: {dependency_status['python_packages']}")
-    print("=" * 60)
+    dependency_status = _dependency_status(dependency_future)
+    summary = dependency_status['summary']
+    tess = dependency_status['tesseract']
+    pkgs = dependency_status['python_packages']
+    body = "\n".join((summary, f"Tesseract: {tess}", f"Python Packages: {pkgs}")) + "\n"
+    # LibreOffice may replace sys.stdout with a shim that has no binary buffer
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is not None:
+        sys.stdout.flush()
+        buffer.write(_SETTINGS_BANNER_BYTES + body.encode(sys.stdout.encoding or 'utf-8', 'replace') + _RULE_BYTES)
+        buffer.flush()
+    else:
+        sys.stdout.write(f"{_SETTINGS_BANNER}\n{body}{_RULE}\n")
     logger.info("Settings information displayed via console")
     return True
 
+def _show_message(toolkit, peer, msg_type, title, message, console_prefix):
+    """Shows an OK message box; prints to the console if the box cannot be shown. Returns True if shown."""
+    try:
+        box = toolkit.createMessageBox(peer, msg_type, 1, title, message)  # 1 = OK button
+        if box:
+            box.execute()
+        return True
+    except Exception as dialog_error:
+        logger.warning("Could not show '%s' dialog: %s", title, dialog_error)
+        print(f"{console_prefix}: {message}")
+        return False
+
+def _spawn_capture(argv, timeout):
+    """Runs argv and returns a subprocess.CompletedProcess with bytes stdout/stderr.
+    Uses posix_spawnp where available so LibreOffice's address space is not fork()ed;
+    falls back to subprocess.run elsewhere (Windows). Raises subprocess.TimeoutExpired on timeout."""
+    import subprocess
+    if not hasattr(os, "posix_spawnp"):
+        return subprocess.run(argv, capture_output=True, timeout=timeout, env=_TESSERACT_ENV)
+    import select
+    import signal
+    # os.pipe() fds are non-inheritable (O_CLOEXEC); DUP2 into 1/2 makes only those visible to the child
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        pid = os.posix_spawnp(argv[0], argv, _TESSERACT_ENV, file_actions=[
+            (os.POSIX_SPAWN_DUP2, out_w, 1),
+            (os.POSIX_SPAWN_DUP2, err_w, 2),
+        ])
+    except OSError:
+        os.close(out_r)
+        os.close(err_r)
+        raise
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+    chunks = {out_r: [], err_r: []}
+    pending = [out_r, err_r]
+    deadline = time.monotonic() + timeout
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                raise subprocess.TimeoutExpired(argv, timeout)
+            ready, _, _ = select.select(pending, [], [], remaining)
+            for fd in ready:
+                data = os.read(fd, 65536)
+                if data:
+                    chunks[fd].append(data)
+                else:
+                    pending.remove(fd)
+    finally:
+        os.close(out_r)
+        os.close(err_r)
+    _, wait_status = os.waitpid(pid, 0)
+    returncode = os.WEXITSTATUS(wait_status) if os.WIFEXITED(wait_status) else -os.WTERMSIG(wait_status)
+    return subprocess.CompletedProcess(argv, returncode, b"".join(chunks[out_r]), b"".join(chunks[err_r]))
+
+# --- Tesseract version probe cache ---
+# cmd path -> (expiry, returncode, version_line, stderr_snippet); spawning tesseract costs
+# hundreds of ms, and the binary rarely changes between check dialog opens.
+_TESSERACT_VERSION_CACHE = {}
+_TESSERACT_VERSION_LOCK = threading.Lock()
+_TESSERACT_VERSION_FUTURE = None # (executable, future) of the pending or finished background probe
+
+def _configured_tesseract():
+    """Resolves the Tesseract executable from the path setting, the PATH and the common install directories."""
+    tess_path_cfg = uno_utils.get_setting(constants.CFG_KEY_TESSERACT_PATH, constants.DEFAULT_TESSERACT_PATH, None)
+    return _find_tess_cached(tess_path_cfg)
+
+def _get_tesseract_version_cached(tess_exec=None, ttl=86400):
+    """Returns (returncode, version_line, stderr_snippet) for `tess_exec --version`, cached for ttl seconds.
+    tess_exec defaults to the configured executable. Raises FileNotFoundError if there is none to run.
+    Use _get_tesseract_version_cached.clear() to force a recheck.
+    OCR runs the executable, so it must exist; if the optional tesserocr binding is installed, its
+    in-process library version is reported instead of spawning the executable."""
+    # Key on the resolved path so a path change invalidates the entry; nothing to spawn if unresolved
+    key = tess_exec or _configured_tesseract()
+    if key is None or not os.path.isfile(key):
+        raise FileNotFoundError(key or "tesseract")
+    with _TESSERACT_VERSION_LOCK:
+        entry = _TESSERACT_VERSION_CACHE.get(key)
+    if entry and time.monotonic() < entry[0]:
+        return entry[1:]
+    result = None
+    try:
+        import tesserocr
+        version_line = tesserocr.tesseract_version().partition('\n')[0].strip() or "Version info unavailable"
+        returncode, stderr_snippet = 0, ''
+    except ImportError:
+        result = _spawn_capture([key, '--version'], timeout=1)
+    except Exception as e:
+        logger.debug(f"tesserocr version query failed, probing {key} instead: {e}")
+        result = _spawn_capture([key, '--version'], timeout=1)
+    if result is not None:
+        returncode = result.returncode
+        version_line = result.stdout.partition(b'\n')[0].decode('utf-8', 'replace').strip() or "Version info unavailable"
+        stderr_snippet = result.stderr[:200].decode('utf-8', 'replace') if result.stderr else 'Unknown error'
+    with _TESSERACT_VERSION_LOCK:
+        _TESSERACT_VERSION_CACHE[key] = (time.monotonic() + ttl, returncode, version_line, stderr_snippet)
+    return returncode, version_line, stderr_snippet
+
+def _clear_tesseract_version_cache():
+    global _TESSERACT_VERSION_FUTURE
+    with _TESSERACT_VERSION_LOCK:
+        _TESSERACT_VERSION_CACHE.clear()
+        _TESSERACT_VERSION_FUTURE = None
+
+_get_tesseract_version_cached.clear = _clear_tesseract_version_cache
+
+def _tesseract_version_future():
+    """Returns a future for the version probe of the configured executable, starting a background
+    probe if there is no fresh result for it. A changed Tesseract path gets a probe of its own."""
+    global _TESSERACT_VERSION_FUTURE
+    tess_exec = _configured_tesseract()
+    with _TESSERACT_VERSION_LOCK:
+        entry = _TESSERACT_VERSION_CACHE.get(tess_exec)
+        fresh = entry is not None and time.monotonic() < entry[0]
+        probed_exec, future = _TESSERACT_VERSION_FUTURE or (None, None)
+        if future is None or probed_exec != tess_exec or (future.done() and not fresh):
+            future = _DEPS_EXECUTOR.submit(_get_tesseract_version_cached, tess_exec)
+            _TESSERACT_VERSION_FUTURE = (tess_exec, future)
+    return future
+
+# Tesseract check outcome -> (message box type, title, message template); 1 = Info box, 2 = Warning box
+_MSGBOX_STYLES = {
+    'ok': (1, "Tesseract Check - SUCCESS",
+           "✓ Tesseract Found!\n\n{version_info}\n\nTesseract is properly installed and accessible."),
+    'err': (2, "Tesseract Check - ERROR",
+            "✗ Tesseract Error\n\nReturn code: {returncode}\nError: {stderr_snippet}\n\nPlease check your Tesseract installation."),
+    'missing': (2, "Tesseract Check - NOT FOUND",
+                "✗ Tesseract Not Found\n\nTesseract is not installed or not in PATH.\n\nInstall with: brew install tesseract"),
+    'failed': (2, "Tesseract Check - ERROR",
+               "✗ Check Failed\n\nError checking Tesseract: {error}\n\nPlease verify your installation manually."),
+}
+
 def _show_tesseract_check_dialog(ctx, parent_frame, toolkit, parent_peer):
     """Show Tesseract installation check dialog."""
+    future = _tesseract_version_future()
     try:
-        import subprocess
-        result = subprocess.run(['tesseract', '--version'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            version_info = result.stdout.strip().split('\n')[0] if result.stdout.strip() else "Version info unavailable"
-            message = f"✓ Tesseract Found!\n\n{version_info}\n\nTesseract is properly installed and accessible."
-            title = "Tesseract Check - SUCCESS"
-            msg_type = 1  # Info box
-        else:
-            message = f"✗ Tesseract Error\n\nReturn code: {result.returncode}\nError: {result.stderr[:200] if result.stderr else 'Unknown error'}\n\nPlease check your Tesseract installation."
-            title = "Tesseract Check - ERROR"
-            msg_type = 2  # Warning box
+        try:
+            returncode, version_info, stderr_snippet = future.result(timeout=0.05)
+        except concurrent.futures.TimeoutError:
+            # Don't block the UI thread on the spawn; reopen once the probe is done
+            future.add_done_callback(lambda f: uno_utils.run_in_main_thread(
+                lambda: _show_tesseract_check_dialog(ctx, parent_frame, toolkit, parent_peer), ctx))
+            _show_message(toolkit, parent_peer, 1, "Tesseract Check",
+                          "⏳ Checking Tesseract installation…\n\nThe result will be shown when the check completes.",
+                          "TESSERACT CHECK")
+            return
+        outcome = 'ok' if returncode == 0 else 'err'
+        fields = {'version_info': version_info, 'returncode': returncode, 'stderr_snippet': stderr_snippet}
     except FileNotFoundError:
-        message = "✗ Tesseract Not Found\n\nTesseract is not installed or not in PATH.\n\nInstall with: brew install tesseract"
-        title = "Tesseract Check - NOT FOUND"
-        msg_type = 2  # Warning box
+        outcome, fields = 'missing', {}
     except Exception as e:
-        message = f"✗ Check Failed\n\nError checking Tesseract: {str(e)[:200]}\n\nPlease verify your installation manually."
-        title = "Tesseract Check - ERROR"
-        msg_type = 2  # Warning box
+        outcome, fields = 'failed', {'error': str(e)[:200]}
     
-    try:
-        box = toolkit.createMessageBox(parent_peer, msg_type, 1, title, message)  # 1 = OK button
-        if box:
-            box.execute()
-    except Exception as dialog_error:
-        logger.warning(f"Could not show Tesseract check dialog: {dialog_error}")
-        print(f"TESSERACT CHECK: {message}")
+    msg_type, title, template = _MSGBOX_STYLES[outcome]
+    message = template.format(**fields)
+    _show_message(toolkit, parent_peer, msg_type, title, message, "TESSERACT CHECK")
 
 def _show_installation_help_dialog(ctx, parent_frame, toolkit, parent_peer):
     """Show installation help dialog."""
-    help_text = f"""Installation Help - {constants.EXTENSION_FULL_NAME}
-
-QUICK SETUP (macOS):
-
-1. Install Tesseract:
-   brew install tesseract
-
-2. Install Python packages:
-   /Applications/LibreOffice.app/Contents/Frameworks/LibreOfficePython.framework/Versions/Current/bin/python3 -m pip install pytesseract pillow
-
-3. Restart LibreOffice
-
-VERIFICATION:
-• Open Terminal
-• Run: tesseract --version
-• Should show version 5.x or higher
-
-TROUBLESHOOTING:
-• Ensure Homebrew is installed
-• Check Python packages in LibreOffice Python
-• Restart LibreOffice after installation
-
-Need more help? Check the extension documentation."""
-
-    try:
-        box = toolkit.createMessageBox(parent_peer, 1, 1, "Installation Help", help_text)  # 1 = Info, 1 = OK
-        if box:
-            box.execute()
-    except Exception as dialog_error:
-        logger.warning(f"Could not show installation help dialog: {dialog_error}")
-        print(f"INSTALLATION HELP:\n{help_text}")
+    _show_message(toolkit, parent_peer, 1, "Installation Help", _INSTALLATION_HELP_TEXT, "INSTALLATION HELP")  # 1 = Info
 
 
 if __name__ == "__main__":
+    import pathlib
+    _XDL_TEMPLATE = '<?xml version="1.0" encoding="UTF-8"?>\n<dlg:window xmlns:dlg="http://openoffice.org/2000/dialog" dlg:id="{id}"><dlg:bulletinboard/></dlg:window>'
+
     # Setup a basic console logger for __main__ block
-    import logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     main_logger = logging.getLogger("TejOCR.Dialogs.__main__")
 
@@ -1397,7 +2086,6 @@ if __name__ == "__main__":
     # Basic mock for testing URL generation (requires constants.py to be findable)
     # This will likely fail if constants.py isn't in the python path correctly
     try:
-        import os
         # Assuming constants.py is in the same directory as this script if run directly
         # or one level up if this script is in a 'python/tejocr' structure
         # This direct run is mostly for syntax checking, real testing needs LO.
@@ -1405,21 +2093,15 @@ if __name__ == "__main__":
         # Attempt to construct a path to where dialogs *would* be
         # This is highly dependent on the current working directory when run directly
         mock_dialogs_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "dialogs")
-        if not os.path.exists(mock_dialogs_dir):
-            os.makedirs(mock_dialogs_dir)
+        os.makedirs(mock_dialogs_dir, exist_ok=True)
         
         mock_options_xdl_path = os.path.join(mock_dialogs_dir, "tejocr_options_dialog.xdl")
         mock_settings_xdl_path = os.path.join(mock_dialogs_dir, "tejocr_settings_dialog.xdl")
 
-        if not os.path.exists(mock_options_xdl_path):
-            with open(mock_options_xdl_path, "w") as f:
-                f.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<dlg:window xmlns:dlg=\"http://openoffice.org/2000/dialog\" dlg:id=\"TejOCROptions\"><dlg:bulletinboard/></dlg:window>")
-            main_logger.info(f"Created mock XDL: {mock_options_xdl_path}")
-
-        if not os.path.exists(mock_settings_xdl_path):
-            with open(mock_settings_xdl_path, "w") as f:
-                f.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<dlg:window xmlns:dlg=\"http://openoffice.org/2000/dialog\" dlg:id=\"TejOCRSettings\"><dlg:bulletinboard/></dlg:window>")
-            main_logger.info(f"Created mock XDL: {mock_settings_xdl_path}")
+        for xdl_path, dialog_id in ((mock_options_xdl_path, "TejOCROptions"), (mock_settings_xdl_path, "TejOCRSettings")):
+            if not os.path.exists(xdl_path):
+                pathlib.Path(xdl_path).write_text(_XDL_TEMPLATE.format(id=dialog_id))
+                main_logger.info(f"Created mock XDL: {xdl_path}")
 
         main_logger.info(f"Mock Options Dialog XDL should be at: {mock_options_xdl_path}")
         main_logger.info(f"Mock Settings Dialog XDL should be at: {mock_settings_xdl_path}")
@@ -1430,6 +2112,6 @@ if __name__ == "__main__":
         # main_logger.info(f"Options Dialog URL (direct run, may be incorrect for LO): {handler.dialog_url}")
 
     except ImportError as ie:
-        main_logger.error(f"ImportError, ensure constants.py is accessible: {ie}", exc_info=True)
+        main_logger.error("ImportError, ensure constants.py is accessible: %s", ie, exc_info=main_logger.isEnabledFor(logging.DEBUG))
     except Exception as e:
-        main_logger.error(f"Error in direct run of tejocr_dialogs.py: {e}", exc_info=True) 
\ No newline at end of file
+        main_logger.error("Error in direct run of tejocr_dialogs.py: %s", e, exc_info=main_logger.isEnabledFor(logging.DEBUG)) 
\ No newline at end of file
@@ -354,7 +354,7 @@ class SettingsDialogHandler(unohelper.Base, XActionListener, XItemListener):
             if lang_combo:
                 selected_text = lang_combo.getText()
                 # Extract language code (e.g., "eng" from "eng - English")
-                lang_code = selected_text.split(" - ")[0] if " - " in selected_text else selected_text
+                lang_code = selected_text.partition(" - ")[0]
                 uno_utils.set_setting(constants.CFG_KEY_DEFAULT_LANG, lang_code, self.ctx)
             
             self.settings_changed = True
@@ -500,7 +500,7 @@ def check_tesseract_path(tesseract_path, ctx=None, parent_frame=None, show_succe
                               capture_output=True, text=True, timeout=10)
         
         if result.returncode == 0:
-            version_info = result.stdout.strip().split('\n')[0] if result.stdout.strip() else "Version info unavailable"
+            version_info = result.stdout.strip().partition('\n')[0] or "Version info unavailable"
             if show_success and show_gui_errors:
                 uno_utils.show_message_box(
                     "Tesseract Test Success",
@@ -624,7 +624,7 @@ def perform_ocr(ctx, frame, source_type, image_path_or_selection_options, ocr_op
         return {"success": False, "text": None, "message": msg}
     except FileNotFoundError:
         msg = _("Image file not found for OCR (it may have been a temporary file that was removed prematurely).") # i18n
-        logger.error(f"FileNotFoundError during OCR. Expected image at: {final_image_for_ocr if 'final_image_for_ocr' in locals() else 'Unknown'}", exc_info=True)
+        logger.error(f"FileNotFoundError during OCR. Expected image at: {final_image_for_ocr or 'Unknown'}", exc_info=True)
         if status_callback: status_callback(_("Error: {message}").format(message=msg)) # i18n
         return {"success": False, "text": None, "message": msg}
     except Exception as e:
@@ -98,6 +98,7 @@ def get_logger(name="TejOCR"):
             def warning(self, msg, *args, **kwargs): self._log("WARNING", msg, *args, **kwargs)
             def error(self, msg, *args, **kwargs): self._log("ERROR", msg, *args, **kwargs)
             def critical(self, msg, *args, **kwargs): self._log("CRITICAL", msg, *args, **kwargs)
+            def isEnabledFor(self, level): return True # Prints every level
 
         # Ensure the dummy logger is also stored to prevent re-attempting setup on every call for this name
         _loggers[name] = PrintLogger()
@@ -1040,6 +1041,37 @@ def is_graphic_object_selected(frame, ctx):
         return False
     return False
 
+try:
+    from com.sun.star.awt import XCallback
+except ImportError:
+    class XCallback: pass
+
+class _MainThreadCallback(unohelper.Base, XCallback):
+    """XCallback that runs a Python callable when LibreOffice processes the queued event."""
+    def __init__(self, func):
+        self._func = func
+
+    def notify(self, data):
+        try:
+            self._func()
+        except Exception as e:
+            logger.error(f"run_in_main_thread: Callback failed: {e}", exc_info=True)
+
+def run_in_main_thread(func, ctx):
+    """Queues func() to run on the LibreOffice main thread via com.sun.star.awt.AsyncCallback.
+    Use this to touch dialog controls from worker threads. If the service is unavailable,
+    func() is called directly. Returns True if the call was queued.
+    """
+    try:
+        async_callback = create_instance("com.sun.star.awt.AsyncCallback", ctx)
+        if async_callback:
+            async_callback.addCallback(_MainThreadCallback(func), None)
+            return True
+    except Exception as e:
+        logger.warning(f"run_in_main_thread: AsyncCallback unavailable, calling directly: {e}")
+    func()
+    return False
+
 # --- Configuration Utilities ---
 _CONFIG_PROVIDER = None
 
@@ -1085,9 +1117,34 @@ def get_setting(key, default_value, ctx, node=constants.CFG_NODE_SETTINGS):
     logger.debug(f"get_setting: Using default for {key}: {default_value}")
     return default_value
 
+def get_settings_batch(defaults, ctx, node=constants.CFG_NODE_SETTINGS):
+    """Reads several settings in one pass over the settings file.
+    defaults maps each wanted key to its default value; returns {key: value} for all of them."""
+    values = dict(defaults)
+    try:
+        settings_file = os.path.join(get_user_temp_dir(), "TejOCRSettings", "settings.txt")
+        if os.path.exists(settings_file):
+            with open(settings_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if '=' in line:
+                        k, v = line.strip().split('=', 1)
+                        if k in values:
+                            values[k] = v.strip()
+    except Exception as e:
+        logger.debug(f"get_settings_batch: File fallback failed: {e}")
+    return values
+
 def set_setting(key, value, ctx, node=constants.CFG_NODE_SETTINGS):
     """Writes a setting to TejOCR configuration with file-based fallback."""
+    return set_settings_batch({key: value}, ctx, node)
+
+def set_settings_batch(values, ctx, node=constants.CFG_NODE_SETTINGS):
+    """Writes several settings with a single read and rewrite of the settings file.
+    values maps each key to its new value; returns True on success."""
+    if not values:
+        return True
     # Quick fallback to file-based settings due to configuration schema issues  
+    tmp_file = None
     try:
         settings_dir = os.path.join(get_user_temp_dir(), "TejOCRSettings")
         os.makedirs(settings_dir, exist_ok=True)
@@ -1102,18 +1159,26 @@ def set_setting(key, value, ctx, node=constants.CFG_NODE_SETTINGS):
                         k, v = line.strip().split('=', 1)
                         existing_settings[k] = v
         
-        # Update the specific setting
-        existing_settings[key] = str(value)
+        # Update the given settings
+        for key, value in values.items():
+            existing_settings[key] = str(value)
         
-        # Write back all settings
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            for k, v in existing_settings.items():
-                f.write(f"{k}={v}\n")
+        # Write back all settings via a per-process temp file, so a failed save never leaves a
+        # half-written file and another LibreOffice process never writes to the same temp file
+        tmp_file = f"{settings_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write("".join(f"{k}={v}\n" for k, v in existing_settings.items()))
+        os.replace(tmp_file, settings_file)
         
-        logger.debug(f"set_setting: Saved {key}={value} to file")
+        logger.debug(f"set_settings_batch: Saved {values} to file")
         return True
     except Exception as e:
-        logger.error(f"set_setting: File fallback failed: {e}")
+        logger.error(f"set_settings_batch: File fallback failed: {e}")
+        if tmp_file:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
         return False
 
 # --- File/Path Utilities ---
@@ -0,0 +1,73 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# © 2025 Devansh (Author of TejOCR)
+
+import unittest
+from unittest.mock import patch
+import os
+import subprocess
+import time
+
+import sys
+# Assuming this test file is in tests/ and the code is in python/tejocr/
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir) # Goes to TejOCR.oxt/
+sys.path.insert(0, os.path.join(project_root, 'python'))
+
+from tejocr import tejocr_dialogs
+
+
+@patch('tejocr.uno_utils.get_logger')
+class TestSpawnCapture(unittest.TestCase):
+    """_spawn_capture runs every tesseract subprocess; exercised here with the Python interpreter."""
+
+    def test_captures_output_and_exit_status(self, mock_logger):
+        code = "import sys; sys.stdout.write('out'); sys.stderr.write('err'); sys.exit(3)"
+        result = tejocr_dialogs._spawn_capture([sys.executable, "-c", code], timeout=5)
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout, b"out")
+        self.assertEqual(result.stderr, b"err")
+
+    def test_success_returns_zero(self, mock_logger):
+        result = tejocr_dialogs._spawn_capture([sys.executable, "-c", "print('tesseract 5.3.4')"], timeout=5)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.strip(), b"tesseract 5.3.4")
+
+    def test_timeout_raises(self, mock_logger):
+        with self.assertRaises(subprocess.TimeoutExpired):
+            tejocr_dialogs._spawn_capture([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5)
+
+    def test_missing_executable_raises_file_not_found(self, mock_logger):
+        with self.assertRaises(FileNotFoundError):
+            tejocr_dialogs._spawn_capture(["tejocr-no-such-tesseract-binary", "--version"], timeout=5)
+
+    def test_version_probe_times_out_after_one_second(self, mock_logger):
+        hung = os.path.join(os.path.dirname(sys.executable), "tejocr-hung-tesseract")
+        real_spawn = tejocr_dialogs._spawn_capture
+        argvs = []
+        def spawn_hung(argv, timeout):
+            # Run a child that never answers in place of `tesseract --version`, with the probe's timeout
+            argvs.append(argv)
+            return real_spawn([sys.executable, "-c", "import time; time.sleep(30)"], timeout=timeout)
+        tejocr_dialogs._get_tesseract_version_cached.clear()
+        with patch('tejocr.tejocr_dialogs.os.path.isfile', return_value=True), \
+             patch('tejocr.tejocr_dialogs._spawn_capture', side_effect=spawn_hung), \
+             patch.dict(sys.modules, {'tesserocr': None}):
+            start = time.monotonic()
+            with self.assertRaises(subprocess.TimeoutExpired) as cm:
+                tejocr_dialogs._get_tesseract_version_cached(hung)
+            elapsed = time.monotonic() - start
+        self.assertEqual(argvs, [[hung, '--version']])
+        self.assertEqual(cm.exception.timeout, 1)
+        self.assertLess(elapsed, 3)
+
+    @unittest.skipUnless(hasattr(os, "posix_spawnp"), "signals are only reported on POSIX")
+    def test_killed_by_signal_returns_negative_status(self, mock_logger):
+        code = "import os, signal; os.kill(os.getpid(), signal.SIGTERM)"
+        result = tejocr_dialogs._spawn_capture([sys.executable, "-c", code], timeout=5)
+        self.assertLess(result.returncode, 0)
+
+if __name__ == '__main__':
+    unittest.main()
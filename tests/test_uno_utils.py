@@ -0,0 +1,79 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# © 2025 Devansh (Author of TejOCR)
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import tempfile
+
+import sys
+# Assuming this test file is in tests/ and the code is in python/tejocr/
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir) # Goes to TejOCR.oxt/
+sys.path.insert(0, os.path.join(project_root, 'python'))
+
+from tejocr import uno_utils
+
+
+@patch('tejocr.uno_utils.get_logger')
+class TestSettingsBatch(unittest.TestCase):
+    """get_settings_batch/set_settings_batch against a settings file in a temporary directory."""
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.mock_ctx = MagicMock() # Mock for UNO context
+        temp_dir_patcher = patch('tejocr.uno_utils.get_user_temp_dir', return_value=self.test_dir.name)
+        temp_dir_patcher.start()
+        self.addCleanup(temp_dir_patcher.stop)
+        self.settings_dir = os.path.join(self.test_dir.name, "TejOCRSettings")
+        self.settings_file = os.path.join(self.settings_dir, "settings.txt")
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def test_get_returns_defaults_without_settings_file(self, mock_logger):
+        values = uno_utils.get_settings_batch({"A": "1", "B": ""}, self.mock_ctx)
+        self.assertEqual(values, {"A": "1", "B": ""})
+
+    def test_get_reads_only_requested_keys(self, mock_logger):
+        os.makedirs(self.settings_dir)
+        with open(self.settings_file, 'w', encoding='utf-8') as f:
+            f.write("A=stored\nOther=x\nPath=C:\\a=b\n")
+        values = uno_utils.get_settings_batch({"A": "1", "B": "2", "Path": ""}, self.mock_ctx)
+        self.assertEqual(values, {"A": "stored", "B": "2", "Path": "C:\\a=b"})
+
+    def test_set_creates_file_and_round_trips(self, mock_logger):
+        self.assertTrue(uno_utils.set_settings_batch({"A": "x", "B": 3}, self.mock_ctx))
+        values = uno_utils.get_settings_batch({"A": "", "B": ""}, self.mock_ctx)
+        self.assertEqual(values, {"A": "x", "B": "3"})
+
+    def test_set_updates_given_keys_and_keeps_others(self, mock_logger):
+        uno_utils.set_settings_batch({"A": "1", "B": "2"}, self.mock_ctx)
+        uno_utils.set_settings_batch({"B": "changed"}, self.mock_ctx)
+        values = uno_utils.get_settings_batch({"A": "", "B": ""}, self.mock_ctx)
+        self.assertEqual(values, {"A": "1", "B": "changed"})
+
+    def test_set_leaves_no_temp_file(self, mock_logger):
+        uno_utils.set_settings_batch({"A": "1"}, self.mock_ctx)
+        self.assertEqual(os.listdir(self.settings_dir), ["settings.txt"])
+
+    def test_set_with_no_values_does_not_write(self, mock_logger):
+        self.assertTrue(uno_utils.set_settings_batch({}, self.mock_ctx))
+        self.assertFalse(os.path.exists(self.settings_file))
+
+    def test_failed_write_keeps_previous_file(self, mock_logger):
+        uno_utils.set_settings_batch({"A": "1"}, self.mock_ctx)
+        with patch('tejocr.uno_utils.os.replace', side_effect=OSError("disk full")):
+            self.assertFalse(uno_utils.set_settings_batch({"A": "2"}, self.mock_ctx))
+        self.assertEqual(uno_utils.get_settings_batch({"A": ""}, self.mock_ctx), {"A": "1"})
+        self.assertEqual(os.listdir(self.settings_dir), ["settings.txt"])
+
+    def test_set_setting_matches_batch(self, mock_logger):
+        uno_utils.set_setting("A", "single", self.mock_ctx)
+        self.assertEqual(uno_utils.get_setting("A", "", self.mock_ctx), "single")
+
+if __name__ == '__main__':
+    unittest.main()